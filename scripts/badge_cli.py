@@ -7,10 +7,93 @@ Master CLI tool for earning GitHub achievement badges.
 
 import os
 import sys
+import mmap
+import codecs
+import functools
 import click
-from colorama import init, Fore, Style
+from typing import Iterator, Optional, Tuple
 
-init(autoreset=True)
+from colors import Fore, Style
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+GUIDES_DIR = os.path.join(REPO_ROOT, 'guides')
+
+# Static help text, built once and written in a single call
+TIPS_TEXT = f"""{Fore.GREEN}🏆 Quick Badge Earning Tips{Style.RESET_ALL}
+
+{Fore.CYAN}🎯 NEW: Comprehensive Badge Earning:{Style.RESET_ALL}
+  badge earn plan             # See personalized earning plan
+  badge earn execute          # Automatically earn all possible badges
+  badge earn all --execute    # Full automation with verification
+
+{Fore.CYAN}🚀 Start Here (5-30 minutes):{Style.RESET_ALL}
+  1. badge quickdraw          # Easiest badge (5 min)
+  2. Create simple repo and merge PR without review (YOLO)
+  3. Sponsor someone $1/month (Public Sponsor)
+
+{Fore.YELLOW}📈 Build Momentum (1-4 weeks):{Style.RESET_ALL}
+  1. badge find-repos         # Find contribution opportunities
+  2. Make your first merged PR (Heart On Your Sleeve)
+  3. Contribute to 2+ repos (Open Sourcerer)
+
+{Fore.MAGENTA}🎯 Long Term (1-6 months):{Style.RESET_ALL}
+  1. badge discussions        # Answer GitHub discussions
+  2. badge coauthor          # Work with others
+  3. Build popular project (Starstruck)
+
+{Fore.GREEN}Commands:{Style.RESET_ALL}
+  badge status               # Check your progress
+  badge earn all --execute   # Earn all possible badges automatically
+  badge guide all           # See all guides
+  badge --help              # Full command list
+"""
+
+TOKEN_HELP_TEXT = f"""{Fore.RED}❌ GitHub token not found{Style.RESET_ALL}
+
+{Fore.YELLOW}To set up your GitHub token:{Style.RESET_ALL}
+1. Go to https://github.com/settings/tokens
+2. Create a personal access token with 'repo' scope
+3. Set environment variable:
+   export GITHUB_TOKEN='your_token_here'
+4. Add to your shell profile (.bashrc, .zshrc, etc.)
+"""
+
+@functools.lru_cache(maxsize=1)
+def _guide_files() -> Optional[Tuple[str, ...]]:
+    """Sorted guide file names, or None if the guides directory is missing"""
+    try:
+        with os.scandir(GUIDES_DIR) as entries:
+            return tuple(sorted(entry.name for entry in entries
+                                if entry.is_file() and entry.name.endswith('.md') and entry.name != 'README.md'))
+    except FileNotFoundError:
+        return None
+
+def _iter_file(path: str, chunk_size: int = 8192) -> Iterator[str]:
+    """Yield a UTF-8 file's text in chunks, read from a read-only memory map"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                # The incremental decoder holds back multi-byte characters
+                # split across chunk boundaries
+                yield decoder.decode(mm[start:start + chunk_size])
+    yield decoder.decode(b'', final=True)
+
+def _require_token():
+    """Return the GitHub token, or print setup help and exit if it is missing"""
+    from github_client import get_token
+    token = get_token()
+    if not token:
+        click.echo(f"{Fore.RED}❌ GitHub token required. Run 'badge setup' first.")
+        sys.exit(1)
+    return token
+
+def _run(command, args):
+    """Run another script's Click command in this interpreter"""
+    command.main(args=args, standalone_mode=False)
 
 @click.group()
 @click.version_option(version='1.0.0')
@@ -25,53 +108,62 @@ def cli():
 @cli.command()
 def status():
     """Check your current badge progress"""
+    _require_token()
     click.echo(f"{Fore.CYAN}Checking badge progress...")
-    os.system(f"python {os.path.dirname(__file__)}/badge_tracker.py summary")
+    from badge_tracker import cli as tracker_cli
+    _run(tracker_cli, ['summary'])
 
 @cli.command()
 @click.option('--language', help='Filter by programming language')
 @click.option('--interactive', is_flag=True, help='Interactive mode')
 def find_repos(language, interactive):
     """Find repositories for contributions (Heart On Your Sleeve, Pull Shark)"""
-    cmd = f"python {os.path.dirname(__file__)}/pr_automation.py"
+    _require_token()
+    from pr_automation import main as pr_main
+    args = []
     if language:
-        cmd += f" --language {language}"
+        args += ['--language', language]
     if interactive:
-        cmd += " --interactive"
-    os.system(cmd)
+        args.append('--interactive')
+    _run(pr_main, args)
 
 @cli.command()
 @click.option('--repo', help='Repository name (owner/repo)')
 def quickdraw(repo):
     """Earn Quickdraw badge (5 minutes)"""
-    cmd = f"python {os.path.dirname(__file__)}/quickdraw_automation.py quick-issue"
+    _require_token()
+    from quickdraw_automation import cli as quickdraw_cli
+    args = ['quick-issue']
     if repo:
-        cmd += f" --repo {repo}"
-    os.system(cmd)
+        args += ['--repo', repo]
+    _run(quickdraw_cli, args)
 
 @cli.command()
 @click.option('--name', help='Co-author name')
 @click.option('--email', help='Co-author email')
 def coauthor(name, email):
     """Generate co-author commit message (Pair Extraordinaire)"""
-    cmd = f"python {os.path.dirname(__file__)}/coauthor_helper.py"
+    from coauthor_helper import cli as coauthor_cli
     if name and email:
-        cmd += f" create-message --name '{name}' --email '{email}'"
+        args = ['create-message', '--name', name, '--email', email]
     else:
-        cmd += " guide"
-    os.system(cmd)
+        args = ['guide']
+    _run(coauthor_cli, args)
 
 @cli.command()
 @click.option('--topic', help='Filter by topic')
 @click.option('--language', help='Filter by language')
-def discussions(topic, language):
+@click.option('--unanswered', is_flag=True, help='List unanswered discussions instead of repositories')
+def discussions(topic, language, unanswered):
     """Find GitHub discussions (Galaxy Brain)"""
-    cmd = f"python {os.path.dirname(__file__)}/discussion_finder.py find-repos"
+    _require_token()
+    from discussion_finder import cli as discussion_cli
+    args = ['find-unanswered' if unanswered else 'find-repos']
     if topic:
-        cmd += f" --topic {topic}"
+        args += ['--topic', topic]
     if language:
-        cmd += f" --language {language}"
-    os.system(cmd)
+        args += ['--language', language]
+    _run(discussion_cli, args)
 
 @cli.group()
 def guide():
@@ -81,116 +173,80 @@ def guide():
 @guide.command()
 def quickdraw():
     """Quickdraw badge guide"""
-    guide_file = os.path.join(os.path.dirname(__file__), '..', 'guides', 'quickdraw.md')
+    guide_file = os.path.join(GUIDES_DIR, 'quickdraw.md')
     if os.path.exists(guide_file):
-        with open(guide_file, 'r') as f:
-            content = f.read()
-        click.echo_via_pager(content)
+        click.echo_via_pager(_iter_file(guide_file))
     else:
         click.echo(f"{Fore.RED}Guide file not found: {guide_file}")
 
 @guide.command()  
 def heart():
     """Heart On Your Sleeve badge guide"""
-    guide_file = os.path.join(os.path.dirname(__file__), '..', 'guides', 'heart-on-your-sleeve.md')
+    guide_file = os.path.join(GUIDES_DIR, 'heart-on-your-sleeve.md')
     if os.path.exists(guide_file):
-        with open(guide_file, 'r') as f:
-            content = f.read()
-        click.echo_via_pager(content)
+        click.echo_via_pager(_iter_file(guide_file))
     else:
         click.echo(f"{Fore.RED}Guide file not found: {guide_file}")
 
 @guide.command()
 def all():
     """List all available guides"""
-    guides_dir = os.path.join(os.path.dirname(__file__), '..', 'guides')
-    if os.path.exists(guides_dir):
-        click.echo(f"{Fore.GREEN}📚 Available Badge Guides:")
-        click.echo()
-        for file in sorted(os.listdir(guides_dir)):
-            if file.endswith('.md') and file != 'README.md':
-                badge_name = file.replace('.md', '').replace('-', ' ').title()
-                click.echo(f"  • {badge_name} - badge guide {file.replace('.md', '')}")
-        click.echo()
-        click.echo(f"{Fore.YELLOW}Use: badge guide <name> to view specific guides")
-    else:
+    files = _guide_files()
+    if files is None:
         click.echo(f"{Fore.RED}Guides directory not found")
+        return
+        
+    lines = [f"{Fore.GREEN}📚 Available Badge Guides:{Style.RESET_ALL}", ""]
+    for file in files:
+        badge_name = file.replace('.md', '').replace('-', ' ').title()
+        lines.append(f"  • {badge_name} - badge guide {file.replace('.md', '')}")
+    lines.append("")
+    lines.append(f"{Fore.YELLOW}Use: badge guide <name> to view specific guides")
+    click.echo("\n".join(lines))
 
 @cli.command()
 def tips():
     """Show quick tips for earning badges"""
-    click.echo(f"{Fore.GREEN}🏆 Quick Badge Earning Tips")
-    click.echo()
-    click.echo(f"{Fore.CYAN}🎯 NEW: Comprehensive Badge Earning:")
-    click.echo(f"  badge earn plan             # See personalized earning plan")
-    click.echo(f"  badge earn execute          # Automatically earn all possible badges")
-    click.echo(f"  badge earn all --execute    # Full automation with verification")
-    click.echo()
-    click.echo(f"{Fore.CYAN}🚀 Start Here (5-30 minutes):")
-    click.echo(f"  1. badge quickdraw          # Easiest badge (5 min)")
-    click.echo(f"  2. Create simple repo and merge PR without review (YOLO)")
-    click.echo(f"  3. Sponsor someone $1/month (Public Sponsor)")
-    click.echo()
-    click.echo(f"{Fore.YELLOW}📈 Build Momentum (1-4 weeks):")
-    click.echo(f"  1. badge find-repos         # Find contribution opportunities")
-    click.echo(f"  2. Make your first merged PR (Heart On Your Sleeve)")
-    click.echo(f"  3. Contribute to 2+ repos (Open Sourcerer)")
-    click.echo()
-    click.echo(f"{Fore.MAGENTA}🎯 Long Term (1-6 months):")
-    click.echo(f"  1. badge discussions        # Answer GitHub discussions")
-    click.echo(f"  2. badge coauthor          # Work with others")
-    click.echo(f"  3. Build popular project (Starstruck)")
-    click.echo()
-    click.echo(f"{Fore.GREEN}Commands:")
-    click.echo(f"  badge status               # Check your progress")
-    click.echo(f"  badge earn all --execute   # Earn all possible badges automatically")
-    click.echo(f"  badge guide all           # See all guides")
-    click.echo(f"  badge --help              # Full command list")
+    click.echo(TIPS_TEXT, nl=False)
 
 @cli.command()
 def setup():
     """Setup GitHub token and dependencies"""
-    click.echo(f"{Fore.GREEN}🔧 GitHub Achievement Setup")
-    click.echo()
+    lines = [f"{Fore.GREEN}🔧 GitHub Achievement Setup{Style.RESET_ALL}", ""]
     
     # Check if token is set
-    token = os.environ.get('GITHUB_TOKEN')
+    from github_client import get_token
+    token = get_token()
     if token:
-        click.echo(f"{Fore.GREEN}✅ GitHub token is configured")
+        lines.append(f"{Fore.GREEN}✅ GitHub token is configured{Style.RESET_ALL}")
     else:
-        click.echo(f"{Fore.RED}❌ GitHub token not found")
-        click.echo()
-        click.echo(f"{Fore.YELLOW}To set up your GitHub token:")
-        click.echo("1. Go to https://github.com/settings/tokens")
-        click.echo("2. Create a personal access token with 'repo' scope")
-        click.echo("3. Set environment variable:")
-        click.echo("   export GITHUB_TOKEN='your_token_here'")
-        click.echo("4. Add to your shell profile (.bashrc, .zshrc, etc.)")
-        click.echo()
+        lines.append(TOKEN_HELP_TEXT)
     
     # Check dependencies
     try:
         import github
         import requests
-        import tabulate
-        click.echo(f"{Fore.GREEN}✅ Python dependencies installed")
+        lines.append(f"{Fore.GREEN}✅ Python dependencies installed{Style.RESET_ALL}")
     except ImportError as e:
-        click.echo(f"{Fore.RED}❌ Missing dependencies: {e}")
-        click.echo(f"{Fore.YELLOW}Install with: pip install -r requirements.txt")
-        click.echo()
+        lines.append(f"{Fore.RED}❌ Missing dependencies: {e}{Style.RESET_ALL}")
+        lines.append(f"{Fore.YELLOW}Install with: pip install -r requirements.txt{Style.RESET_ALL}")
+        lines.append("")
     
     # Check if guides exist
-    guides_dir = os.path.join(os.path.dirname(__file__), '..', 'guides')
-    if os.path.exists(guides_dir):
-        click.echo(f"{Fore.GREEN}✅ Badge guides available")
+    guides_available = _guide_files() is not None
+    if guides_available:
+        lines.append(f"{Fore.GREEN}✅ Badge guides available{Style.RESET_ALL}")
     else:
-        click.echo(f"{Fore.RED}❌ Badge guides not found")
+        lines.append(f"{Fore.RED}❌ Badge guides not found{Style.RESET_ALL}")
     
-    click.echo()
-    if token and os.path.exists(guides_dir):
-        click.echo(f"{Fore.GREEN}🎉 Setup complete! Try: badge tips")
+    lines.append("")
+    if token and guides_available:
+        lines.append(f"{Fore.GREEN}🎉 Setup complete! Try: badge tips")
     else:
-        click.echo(f"{Fore.YELLOW}⚠️  Complete setup steps above, then run: badge tips")
+        lines.append(f"{Fore.YELLOW}⚠️  Complete setup steps above, then run: badge tips")
+    
+    # One write instead of a dozen separate echo calls
+    click.echo("\n".join(lines))
 
 @cli.command()
 def dashboard():
@@ -201,10 +257,10 @@ def dashboard():
     
     # Try to get GitHub username
     try:
-        if os.environ.get('GITHUB_TOKEN'):
-            from github import Github
-            g = Github(os.environ['GITHUB_TOKEN'])
-            username = g.get_user().login
+        from github_client import get_login, get_token
+        token = get_token()
+        if token:
+            username = get_login(token)
             url = f"https://github.com/{username}?tab=achievements"
         else:
             url = "https://github.com/settings/profile"
@@ -224,39 +280,28 @@ def earn():
 @click.option('--verify', is_flag=True, help='Verify progress after execution')
 def all(execute, verify):
     """Create and execute comprehensive badge earning plan"""
-    token = os.environ.get('GITHUB_TOKEN')
-    if not token:
-        click.echo(f"{Fore.RED}❌ GitHub token required. Run 'badge setup' first.")
-        return
-        
-    cmd = f"python {os.path.dirname(__file__)}/badge_orchestrator.py earn-all"
+    _require_token()
+    from badge_orchestrator import cli as orchestrator_cli
+    args = ['earn-all']
     if execute:
-        cmd += " --execute"
+        args.append('--execute')
     if verify:
-        cmd += " --verify"
-    os.system(cmd)
+        args.append('--verify')
+    _run(orchestrator_cli, args)
 
 @earn.command()
 def plan():
     """Show badge earning plan without execution"""
-    token = os.environ.get('GITHUB_TOKEN')
-    if not token:
-        click.echo(f"{Fore.RED}❌ GitHub token required. Run 'badge setup' first.")
-        return
-        
-    cmd = f"python {os.path.dirname(__file__)}/badge_orchestrator.py plan"
-    os.system(cmd)
+    _require_token()
+    from badge_orchestrator import cli as orchestrator_cli
+    _run(orchestrator_cli, ['plan'])
 
 @earn.command()
 def execute():
     """Execute automated badge earning with verification"""
-    token = os.environ.get('GITHUB_TOKEN')
-    if not token:
-        click.echo(f"{Fore.RED}❌ GitHub token required. Run 'badge setup' first.")
-        return
-        
-    cmd = f"python {os.path.dirname(__file__)}/badge_orchestrator.py execute"
-    os.system(cmd)
+    _require_token()
+    from badge_orchestrator import cli as orchestrator_cli
+    _run(orchestrator_cli, ['execute'])
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
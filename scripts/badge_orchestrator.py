@@ -11,147 +11,188 @@ import sys
 import time
 import click
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from github import Github
-from colorama import init, Fore, Style
-from typing import List, Dict, Optional, Tuple
-import subprocess
+from typing import Callable, Dict, List, Optional, Tuple
 
-# Import existing tools
-from badge_tracker import BadgeTracker
+# Shared GitHub helpers (PyGithub itself is imported lazily)
+from github_client import TOKEN_ENV_VARS, get_github, get_login
+from colors import Fore, Style
+
+
+@dataclass(slots=True, frozen=True)
+class NextRequirement:
+    """The next tier of a badge and how many more are needed to reach it"""
+    tier: str
+    needed: int
+
+
+@dataclass(slots=True)
+class BadgePlanItem:
+    """A badge entry in the earning plan"""
+    name: str
+    description: str
+    next_requirement: Optional[NextRequirement] = None
+    automated: bool = False
+    manual_steps: Tuple[str, ...] = ()
+    tools_available: bool = False
+    tier: Optional[str] = None  # Achieved tier, set for completed badges
 
-init(autoreset=True)
 
 class BadgeOrchestrator:
-    def __init__(self, token: str):
-        self.github = Github(token)
+    # Badges in earning order (easiest to hardest), with the plan category
+    # each one lands in while unearned and its category-specific fields
+    BADGE_TABLE: Tuple[Tuple[str, str, Dict], ...] = (
+        # 5 minutes - can be automated
+        ("Quickdraw", "immediate", {"automated": True}),
+        # 10 minutes - can be automated
+        ("YOLO", "immediate", {"automated": True}),
+        # 5 minutes - manual but easy
+        ("Public Sponsor", "quick", {
+            "automated": False,
+            "manual_steps": ("Go to GitHub Sponsors", "Sponsor any developer $1/month")
+        }),
+        # 1-7 days - can be assisted
+        ("Heart On Your Sleeve", "short_term", {"automated": False, "tools_available": True}),
+        # 1-2 weeks - can be assisted
+        ("Open Sourcerer", "short_term", {"automated": False, "tools_available": True}),
+        # 1-2 months - can be assisted
+        ("Pair Extraordinaire", "short_term", {"automated": False, "tools_available": True}),
+        # 2-6 months - builds on Heart On Your Sleeve
+        ("Pull Shark", "long_term", {"automated": False, "tools_available": False}),
+        # 1-6 months - manual but can be guided
+        ("Galaxy Brain", "long_term", {"automated": False, "tools_available": False}),
+        # 2-12 months - long term manual goal
+        ("Starstruck", "long_term", {"automated": False, "tools_available": False})
+    )
+    
+    PLAN_CATEGORIES = (
+        "immediate",   # Can be done right now (automated)
+        "quick",       # Can be done in minutes/hours (semi-automated)
+        "short_term",  # Days to weeks (guided)
+        "long_term",   # Months (manual with guidance)
+        "completed"    # Already achieved
+    )
+    
+    def __init__(self, token: str, use_cache: bool = True):
+        # Deferred so `--help` does not pay for PyGithub and the tracker
+        from badge_tracker import BadgeTracker
+        
+        # Shared client and cached login: the tracker reuses the login, so
+        # building it does not cost another /user round trip
+        self.github = get_github(token)
         self.token = token
-        self.user = self.github.get_user()
-        self.tracker = BadgeTracker(token)
-        
-        # Badge earning order (easiest to hardest)
-        self.earning_order = [
-            "Quickdraw",           # 5 minutes - can be automated
-            "YOLO",                # 10 minutes - can be automated  
-            "Public Sponsor",      # 5 minutes - manual but easy
-            "Heart On Your Sleeve", # 1-7 days - can be assisted
-            "Open Sourcerer",      # 1-2 weeks - can be assisted
-            "Pair Extraordinaire", # 1-2 months - can be assisted
-            "Pull Shark",          # 2-6 months - builds on Heart On Your Sleeve
-            "Galaxy Brain",        # 1-6 months - manual but can be guided
-            "Starstruck"          # 2-12 months - long term manual goal
-        ]
+        self.user = self.github.get_user()  # Lazy; only fetched when needed
+        self.login = get_login(token)
+        self.tracker = BadgeTracker(token, use_cache=use_cache)
+        
+    def get_progress(self, refresh: bool = False) -> Dict:
+        """Get badge progress; the tracker caches the counts it fetched successfully"""
+        return self.tracker.get_badge_progress(refresh=refresh)
         
     def get_earning_plan(self) -> Dict:
         """Create a personalized badge earning plan"""
         
         print(f"{Fore.CYAN}🎯 Creating personalized badge earning plan...")
-        progress = self.tracker.get_badge_progress()
-        
-        plan = {
-            "immediate": [],     # Can be done right now (automated)
-            "quick": [],         # Can be done in minutes/hours (semi-automated)
-            "short_term": [],    # Days to weeks (guided)
-            "long_term": [],     # Months (manual with guidance)
-            "completed": []      # Already achieved
-        }
+        progress = self.get_progress()
+        
+        plan = {category: [] for category in self.PLAN_CATEGORIES}
         
-        for badge_name in self.earning_order:
-            if badge_name in progress:
-                badge_info = progress[badge_name]
+        for badge_name, category, extra in self.BADGE_TABLE:
+            badge_info = progress.get(badge_name)
+            if not badge_info:
+                continue
                 
-                if badge_info["achieved_tier"]:
-                    plan["completed"].append({
-                        "name": badge_name,
-                        "tier": badge_info["achieved_tier"],
-                        "description": badge_info["description"]
-                    })
-                else:
-                    # Categorize based on difficulty and automation potential
-                    if badge_name in ["Quickdraw", "YOLO"]:
-                        plan["immediate"].append({
-                            "name": badge_name,
-                            "description": badge_info["description"],
-                            "next_requirement": badge_info.get("next_requirement"),
-                            "automated": True
-                        })
-                    elif badge_name in ["Public Sponsor"]:
-                        plan["quick"].append({
-                            "name": badge_name,
-                            "description": badge_info["description"],
-                            "next_requirement": badge_info.get("next_requirement"),
-                            "automated": False,
-                            "manual_steps": ["Go to GitHub Sponsors", "Sponsor any developer $1/month"]
-                        })
-                    elif badge_name in ["Heart On Your Sleeve", "Open Sourcerer", "Pair Extraordinaire"]:
-                        plan["short_term"].append({
-                            "name": badge_name,
-                            "description": badge_info["description"],
-                            "next_requirement": badge_info.get("next_requirement"),
-                            "automated": False,
-                            "tools_available": True
-                        })
-                    else:
-                        plan["long_term"].append({
-                            "name": badge_name,
-                            "description": badge_info["description"],
-                            "next_requirement": badge_info.get("next_requirement"),
-                            "automated": False,
-                            "tools_available": False
-                        })
+            if badge_info["achieved_tier"]:
+                plan["completed"].append(BadgePlanItem(
+                    name=badge_name,
+                    description=badge_info["description"],
+                    tier=badge_info["achieved_tier"]
+                ))
+            else:
+                req = badge_info.get("next_requirement")
+                plan[category].append(BadgePlanItem(
+                    name=badge_name,
+                    description=badge_info["description"],
+                    next_requirement=NextRequirement(req["tier"], req["needed"]) if req else None,
+                    **extra
+                ))
         
         return plan
         
     def execute_immediate_badges(self, plan: Dict) -> List[str]:
         """Execute badges that can be earned immediately through automation"""
         
-        earned_badges = []
+        automations = {
+            "Quickdraw": self._earn_quickdraw_badge,
+            "YOLO": self._earn_yolo_badge
+        }
         
-        for badge in plan["immediate"]:
-            badge_name = badge["name"]
-            
-            print(f"\n{Fore.GREEN}🚀 Attempting to earn: {badge_name}")
-            print(f"{Fore.YELLOW}Description: {badge['description']}")
-            
-            try:
-                if badge_name == "Quickdraw":
-                    success = self._earn_quickdraw_badge()
-                elif badge_name == "YOLO":
-                    success = self._earn_yolo_badge()
-                else:
-                    print(f"{Fore.YELLOW}⚠️  No automation available for {badge_name}")
+        # The workflows are independent and spend their time waiting on the
+        # API, so run them side by side. Keep the pool small so GitHub's
+        # abuse detection does not kick in; PyGithub backs off on its own
+        # when it hits secondary rate limits. Each worker collects its
+        # progress lines, printed under its badge once it finishes, so
+        # output from concurrent workflows does not interleave.
+        futures = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for badge in plan["immediate"]:
+                earn = automations.get(badge.name)
+                if not earn:
+                    print(f"{Fore.YELLOW}⚠️  No automation available for {badge.name}")
                     continue
                     
-                if success:
-                    earned_badges.append(badge_name)
-                    print(f"{Fore.GREEN}✅ Successfully earned {badge_name} badge!")
-                else:
-                    print(f"{Fore.RED}❌ Failed to earn {badge_name} badge")
-                    
-            except Exception as e:
-                print(f"{Fore.RED}❌ Error earning {badge_name}: {e}")
+                lines = []
+                futures[executor.submit(earn, lines.append)] = (badge, lines)
                 
-            # Wait between attempts to avoid rate limiting
-            time.sleep(2)
+            succeeded = set()
+            for future in as_completed(futures):
+                badge, lines = futures[future]
+                badge_name = badge.name
+                print(f"\n{Fore.GREEN}🚀 Attempting to earn: {badge_name}")
+                print(f"{Fore.YELLOW}Description: {badge.description}")
+                for line in lines:
+                    print(line)
+                try:
+                    if future.result():
+                        succeeded.add(badge_name)
+                        print(f"{Fore.GREEN}✅ Successfully earned {badge_name} badge!")
+                    else:
+                        print(f"{Fore.RED}❌ Failed to earn {badge_name} badge")
+                except Exception as e:
+                    print(f"{Fore.RED}❌ Error earning {badge_name}: {e}")
+                    
+        # Report in plan order rather than completion order
+        return [badge.name for badge in plan["immediate"] if badge.name in succeeded]
+        
+    def _get_or_create_scratch_repo(self, prefix: str, log: Callable[[str], None] = print):
+        """Return the user's {prefix}-scratch repository, creating it only once"""
+        from github import UnknownObjectException
+        
+        repo_name = f"{prefix}-scratch"
+        try:
+            repo = self.github.get_repo(f"{self.login}/{repo_name}")
+            log(f"{Fore.GREEN}  ✅ Reusing repository: {repo.full_name}")
+            return repo
+        except UnknownObjectException:
+            pass
             
-        return earned_badges
+        log(f"{Fore.CYAN}  📝 Creating repository {repo_name}...")
+        repo = self.user.create_repo(
+            name=repo_name,
+            description=f"Scratch repository for earning the {prefix.title()} badge",
+            private=False,
+            auto_init=True
+        )
+        log(f"{Fore.GREEN}  ✅ Created repository: {repo.full_name}")
+        return repo
         
-    def _earn_quickdraw_badge(self) -> bool:
+    def _earn_quickdraw_badge(self, log: Callable[[str], None] = print) -> bool:
         """Attempt to earn Quickdraw badge"""
         
-        print(f"{Fore.CYAN}  📝 Creating repository for Quickdraw badge...")
-        
         try:
-            # Create a temporary repository
-            repo_name = f"quickdraw-{int(time.time())}"
-            repo = self.user.create_repo(
-                name=repo_name,
-                description="Temporary repository for earning Quickdraw badge",
-                private=False,
-                auto_init=True
-            )
-            
-            print(f"{Fore.GREEN}  ✅ Created repository: {repo.full_name}")
+            repo = self._get_or_create_scratch_repo("quickdraw", log)
             
             # Create an issue
             issue_title = "Documentation improvement suggestion"
@@ -162,96 +203,75 @@ Quick documentation improvement that can be addressed immediately.
 This issue will be closed as it's addressed by existing documentation.
 """
             
-            print(f"{Fore.CYAN}  📝 Creating issue...")
+            log(f"{Fore.CYAN}  📝 Creating issue...")
             issue = repo.create_issue(title=issue_title, body=issue_body)
-            print(f"{Fore.GREEN}  ✅ Issue created: {issue.number}")
-            
-            # Wait 30 seconds to ensure proper timing
-            print(f"{Fore.YELLOW}  ⏳ Waiting 30 seconds before closing...")
-            time.sleep(30)
+            log(f"{Fore.GREEN}  ✅ Issue created: {issue.number}")
             
-            # Close the issue
+            # Close right away - anything under 5 minutes counts, and a
+            # short pause keeps the open/close events distinct
+            time.sleep(1)
             issue.edit(state="closed")
-            print(f"{Fore.GREEN}  ✅ Issue closed within time limit!")
-            
-            # Clean up - delete the repository
-            print(f"{Fore.CYAN}  🧹 Cleaning up temporary repository...")
-            repo.delete()
-            print(f"{Fore.GREEN}  ✅ Repository cleaned up")
+            log(f"{Fore.GREEN}  ✅ Issue closed within time limit!")
             
             return True
             
         except Exception as e:
-            print(f"{Fore.RED}  ❌ Error in Quickdraw automation: {e}")
-            # Try to clean up if repo was created
-            try:
-                if 'repo' in locals():
-                    repo.delete()
-            except:
-                pass
+            log(f"{Fore.RED}  ❌ Error in Quickdraw automation: {e}")
             return False
             
-    def _earn_yolo_badge(self) -> bool:
+    def _earn_yolo_badge(self, log: Callable[[str], None] = print) -> bool:
         """Attempt to earn YOLO badge"""
         
-        print(f"{Fore.CYAN}  📝 Creating repository for YOLO badge...")
-        
         try:
-            # Create a temporary repository
-            repo_name = f"yolo-badge-{int(time.time())}"
-            repo = self.user.create_repo(
-                name=repo_name,
-                description="Temporary repository for earning YOLO badge",
-                private=False,
-                auto_init=True
-            )
+            repo = self._get_or_create_scratch_repo("yolo", log)
             
-            print(f"{Fore.GREEN}  ✅ Created repository: {repo.full_name}")
-            
-            # Get the main branch
-            main_branch = repo.get_branch("main")
+            # Each run works on its own branch and file, so the scratch
+            # repository can be reused indefinitely
+            timestamp = int(time.time())
+            new_branch_name = f"yolo-{timestamp}"
+            base_branch = repo.default_branch
             
             # Create a new file
             file_content = """# YOLO Badge Earning
             
-This repository was created to earn the YOLO badge by merging a PR without review.
+This file was added to earn the YOLO badge by merging a PR without review.
 
 ## Badge Requirements
 - Merge a pull request without requesting or waiting for reviews
 - This demonstrates confidence in your changes (hence "YOLO" - You Only Live Once)
 
 ## Implementation
-This PR adds this README file to document the badge earning process.
+This PR adds this file to document the badge earning process.
 """
             
             # Create a new branch
-            new_branch_name = "add-readme"
-            new_branch = repo.create_git_ref(
+            base = repo.get_branch(base_branch)
+            branch_ref = repo.create_git_ref(
                 ref=f"refs/heads/{new_branch_name}",
-                sha=main_branch.commit.sha
+                sha=base.commit.sha
             )
             
-            print(f"{Fore.GREEN}  ✅ Created branch: {new_branch_name}")
+            log(f"{Fore.GREEN}  ✅ Created branch: {new_branch_name}")
             
             # Create file in new branch
             repo.create_file(
-                path="README.md",
-                message="Add README for YOLO badge earning",
+                path=f"yolo/{timestamp}.md",
+                message="Add notes for YOLO badge earning",
                 content=file_content,
                 branch=new_branch_name
             )
             
-            print(f"{Fore.GREEN}  ✅ Created file in branch")
+            log(f"{Fore.GREEN}  ✅ Created file in branch")
             
             # Create pull request
             pr = repo.create_pull(
-                title="Add README for YOLO badge",
-                body="Adding README file to document YOLO badge earning process.\n\nThis PR will be merged without review to earn the YOLO badge.",
+                title="Add notes for YOLO badge",
+                body="Adding a file to document YOLO badge earning process.\n\nThis PR will be merged without review to earn the YOLO badge.",
                 head=new_branch_name,
-                base="main"
+                base=base_branch
             )
             
-            print(f"{Fore.GREEN}  ✅ Created PR: {pr.number}")
+            log(f"{Fore.GREEN}  ✅ Created PR: {pr.number}")
             
             # Merge immediately without review (YOLO!)
             merge_result = pr.merge(
@@ -259,23 +279,16 @@ This PR adds this README file to document the badge earning process.
                 merge_method="merge"
             )
             
-            print(f"{Fore.GREEN}  ✅ PR merged without review - YOLO badge earned!")
+            log(f"{Fore.GREEN}  ✅ PR merged without review - YOLO badge earned!")
             
-            # Clean up - delete the repository
-            print(f"{Fore.CYAN}  🧹 Cleaning up temporary repository...")
-            repo.delete()
-            print(f"{Fore.GREEN}  ✅ Repository cleaned up")
+            # Clean up - only the branch, the repository is kept for next time
+            branch_ref.delete()
+            log(f"{Fore.GREEN}  ✅ Branch {new_branch_name} cleaned up")
             
             return True
             
         except Exception as e:
-            print(f"{Fore.RED}  ❌ Error in YOLO automation: {e}")
-            # Try to clean up if repo was created
-            try:
-                if 'repo' in locals():
-                    repo.delete()
-            except:
-                pass
+            log(f"{Fore.RED}  ❌ Error in YOLO automation: {e}")
             return False
             
     def provide_guidance_for_remaining_badges(self, plan: Dict):
@@ -287,44 +300,43 @@ This PR adds this README file to document the badge earning process.
         if plan["quick"]:
             print(f"\n{Fore.YELLOW}⚡ Quick Wins (Manual - 5-30 minutes):")
             for badge in plan["quick"]:
-                print(f"\n  🎯 {badge['name']}")
-                print(f"     📝 {badge['description']}")
-                if "manual_steps" in badge:
-                    for i, step in enumerate(badge["manual_steps"], 1):
-                        print(f"     {i}. {step}")
-                        
+                print(f"\n  🎯 {badge.name}")
+                print(f"     📝 {badge.description}")
+                for i, step in enumerate(badge.manual_steps, 1):
+                    print(f"     {i}. {step}")
+                    
         if plan["short_term"]:
             print(f"\n{Fore.GREEN}📈 Short-term Goals (Tool-assisted - Days to weeks):")
             for badge in plan["short_term"]:
-                print(f"\n  🎯 {badge['name']}")
-                print(f"     📝 {badge['description']}")
-                if badge.get("next_requirement"):
-                    req = badge["next_requirement"]
-                    print(f"     🎯 Next: {req['tier']} tier ({req['needed']} more needed)")
+                print(f"\n  🎯 {badge.name}")
+                print(f"     📝 {badge.description}")
+                req = badge.next_requirement
+                if req:
+                    print(f"     🎯 Next: {req.tier} tier ({req.needed} more needed)")
                     
                 # Provide tool suggestions
-                if badge["name"] == "Heart On Your Sleeve":
+                if badge.name == "Heart On Your Sleeve":
                     print(f"     🛠️  Use: python scripts/badge_cli.py find-repos")
-                elif badge["name"] == "Open Sourcerer":
+                elif badge.name == "Open Sourcerer":
                     print(f"     🛠️  Use: python scripts/badge_cli.py find-repos --language <your_language>")
-                elif badge["name"] == "Pair Extraordinaire":
+                elif badge.name == "Pair Extraordinaire":
                     print(f"     🛠️  Use: python scripts/badge_cli.py coauthor")
                     
         if plan["long_term"]:
             print(f"\n{Fore.MAGENTA}🏔️  Long-term Goals (Manual - Months):")
             for badge in plan["long_term"]:
-                print(f"\n  🎯 {badge['name']}")
-                print(f"     📝 {badge['description']}")
-                if badge.get("next_requirement"):
-                    req = badge["next_requirement"]
-                    print(f"     🎯 Next: {req['tier']} tier ({req['needed']} more needed)")
+                print(f"\n  🎯 {badge.name}")
+                print(f"     📝 {badge.description}")
+                req = badge.next_requirement
+                if req:
+                    print(f"     🎯 Next: {req.tier} tier ({req.needed} more needed)")
                     
                 # Provide strategy suggestions
-                if badge["name"] == "Starstruck":
+                if badge.name == "Starstruck":
                     print(f"     💡 Strategy: Create useful open source projects")
-                elif badge["name"] == "Galaxy Brain":
+                elif badge.name == "Galaxy Brain":
                     print(f"     💡 Strategy: Answer GitHub Discussions")
-                elif badge["name"] == "Pull Shark":
+                elif badge.name == "Pull Shark":
                     print(f"     💡 Strategy: Continue contributing (builds on Heart On Your Sleeve)")
                     
     def verify_badge_progress(self) -> Dict:
@@ -332,11 +344,10 @@ This PR adds this README file to document the badge earning process.
         
         print(f"\n{Fore.CYAN}🔍 Verifying badge progress...")
         
-        # Wait a moment for GitHub to process
-        time.sleep(5)
-        
-        # Get fresh progress data
-        progress = self.tracker.get_badge_progress()
+        # Quickdraw and YOLO, the only badges earned here, are not visible
+        # through the API, so waiting for them to appear would never pay
+        # off. Read once, bypassing the cache that predates our changes.
+        progress = self.get_progress(refresh=True)
         
         # Count achievements
         earned_count = sum(1 for badge in progress.values() if badge["achieved_tier"])
@@ -347,19 +358,70 @@ This PR adds this README file to document the badge earning process.
         print(f"   📈 Completion: {earned_count/total_count*100:.1f}%")
         
         return progress
+        
+    def run_plan(self, execute: bool, verify: bool):
+        """Show the earning plan, optionally executing and verifying it"""
+        
+        print(f"{Fore.GREEN}🏆 GitHub Achievement Badge Orchestrator")
+        print(f"{Fore.CYAN}User: {self.login}")
+        print(f"{Fore.CYAN}Mode: {'Execute + Plan' if execute else 'Plan Only'}")
+        print("=" * 60)
+        
+        earned = []
+        
+        # Get personalized earning plan
+        plan = self.get_earning_plan()
+        
+        # Show current progress
+        if plan["completed"]:
+            print(f"\n{Fore.GREEN}✅ Already Earned ({len(plan['completed'])}):")
+            for badge in plan["completed"]:
+                print(f"   🏆 {badge.name} ({badge.tier} tier)")
+        
+        # Show what can be earned immediately
+        if plan["immediate"]:
+            print(f"\n{Fore.CYAN}🚀 Available for Immediate Earning ({len(plan['immediate'])}):")
+            for badge in plan["immediate"]:
+                print(f"   ⚡ {badge.name} - {badge.description}")
+                
+            if execute:
+                print(f"\n{Fore.YELLOW}🎯 Executing immediate badge earning...")
+                earned = self.execute_immediate_badges(plan)
+                
+                if earned:
+                    print(f"\n{Fore.GREEN}🎉 Successfully earned {len(earned)} badge(s): {', '.join(earned)}")
+                else:
+                    print(f"\n{Fore.YELLOW}⚠️  No badges were automatically earned (may require manual verification)")
+            else:
+                print(f"\n{Fore.YELLOW}💡 Run with --execute flag to automatically earn these badges")
+        
+        # Provide guidance for remaining badges
+        self.provide_guidance_for_remaining_badges(plan)
+        
+        # Verify progress if requested
+        if verify:
+            self.verify_badge_progress()
+        
+        # Show next steps
+        print(f"\n{Fore.GREEN}🎯 Next Steps:")
+        print(f"   1. Run: python scripts/badge_cli.py status  # Check current progress")
+        print(f"   2. Follow the guidance above for remaining badges")
+        print(f"   3. Use: python scripts/badge_cli.py dashboard  # View your achievements")
+        print(f"   4. Re-run this command periodically to track progress")
 
 @click.group()
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar=TOKEN_ENV_VARS, help='GitHub personal access token')
+@click.option('--no-cache', is_flag=True, help='Ignore badge counts cached within the last hour and query GitHub')
 @click.pass_context
-def cli(ctx, token):
+def cli(ctx, token, no_cache):
     """Badge Orchestrator - Comprehensive Badge Earning Automation"""
     if not token:
-        print(f"{Fore.RED}❌ GitHub token required. Set GITHUB_TOKEN environment variable or use --token")
+        print(f"{Fore.RED}❌ GitHub token required. Set GITHUB_TOKEN (or BADGE_CLI_GITHUB_TOKEN) or use --token")
         print(f"{Fore.YELLOW}⚠️  Security Note: Never commit tokens to repositories!")
         sys.exit(1)
         
     ctx.ensure_object(dict)
-    ctx.obj['orchestrator'] = BadgeOrchestrator(token)
+    ctx.obj['orchestrator'] = BadgeOrchestrator(token, use_cache=not no_cache)
 
 @cli.command()
 @click.option('--execute', is_flag=True, help='Execute automated badge earning (not just plan)')
@@ -367,65 +429,19 @@ def cli(ctx, token):
 @click.pass_context
 def earn_all(ctx, execute, verify):
     """Create and optionally execute a comprehensive badge earning plan"""
-    
-    orchestrator = ctx.obj['orchestrator']
-    
-    print(f"{Fore.GREEN}🏆 GitHub Achievement Badge Orchestrator")
-    print(f"{Fore.CYAN}User: {orchestrator.user.login}")
-    print(f"{Fore.CYAN}Mode: {'Execute + Plan' if execute else 'Plan Only'}")
-    print("=" * 60)
-    
-    # Get personalized earning plan
-    plan = orchestrator.get_earning_plan()
-    
-    # Show current progress
-    if plan["completed"]:
-        print(f"\n{Fore.GREEN}✅ Already Earned ({len(plan['completed'])}):")
-        for badge in plan["completed"]:
-            print(f"   🏆 {badge['name']} ({badge['tier']} tier)")
-    
-    # Show what can be earned immediately
-    if plan["immediate"]:
-        print(f"\n{Fore.CYAN}🚀 Available for Immediate Earning ({len(plan['immediate'])}):")
-        for badge in plan["immediate"]:
-            print(f"   ⚡ {badge['name']} - {badge['description']}")
-            
-        if execute:
-            print(f"\n{Fore.YELLOW}🎯 Executing immediate badge earning...")
-            earned = orchestrator.execute_immediate_badges(plan)
-            
-            if earned:
-                print(f"\n{Fore.GREEN}🎉 Successfully earned {len(earned)} badge(s): {', '.join(earned)}")
-            else:
-                print(f"\n{Fore.YELLOW}⚠️  No badges were automatically earned (may require manual verification)")
-        else:
-            print(f"\n{Fore.YELLOW}💡 Run with --execute flag to automatically earn these badges")
-    
-    # Provide guidance for remaining badges
-    orchestrator.provide_guidance_for_remaining_badges(plan)
-    
-    # Verify progress if requested
-    if verify:
-        final_progress = orchestrator.verify_badge_progress()
-    
-    # Show next steps
-    print(f"\n{Fore.GREEN}🎯 Next Steps:")
-    print(f"   1. Run: python scripts/badge_cli.py status  # Check current progress")
-    print(f"   2. Follow the guidance above for remaining badges")
-    print(f"   3. Use: python scripts/badge_cli.py dashboard  # View your achievements")
-    print(f"   4. Re-run this command periodically to track progress")
+    ctx.obj['orchestrator'].run_plan(execute, verify)
 
 @cli.command()
 @click.pass_context
 def plan(ctx):
     """Show badge earning plan without execution"""
-    ctx.invoke(earn_all, execute=False, verify=False)
+    ctx.obj['orchestrator'].run_plan(execute=False, verify=False)
 
 @cli.command()
 @click.pass_context
 def execute(ctx):
     """Execute automated badge earning with verification"""
-    ctx.invoke(earn_all, execute=True, verify=True)
+    ctx.obj['orchestrator'].run_plan(execute=True, verify=True)
 
 if __name__ == "__main__":
-    cli()
\ No newline at end of file
+    cli()
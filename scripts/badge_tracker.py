@@ -8,21 +8,86 @@ This script tracks your progress towards GitHub achievement badges.
 import os
 import sys
 import json
+import threading
 import click
-import requests
+import bisect
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from github import Github
-from colorama import init, Fore, Style
-from tabulate import tabulate
 from typing import Dict, List, Optional
 
-init(autoreset=True)
+from github_client import (
+    TOKEN_ENV_VARS, conditional_get, get_login, graphql, json_loads, read_cache,
+    rest_get, write_cache
+)
+from colors import Fore, Style
+
+COUNT_CACHE_FILE = "counts.json"
+COUNT_CACHE_TTL = 60 * 60  # PR and star counts move slowly; the only cache in front of progress
+BATCH_COUNT_METHODS = (
+    "count_merged_prs",
+    "count_repos_with_merged_prs",
+    "count_max_stars",
+    "check_sponsorships",
+    "count_discussion_answers"
+)
+
+# Every API-backed count, fetched in one round trip
+PROGRESS_QUERY = """
+query($mergedQuery: String!) {
+  mergedPRs: search(query: $mergedQuery, type: ISSUE, first: 100) {
+    issueCount
+    nodes { ... on PullRequest { repository { nameWithOwner } } }
+  }
+  viewer {
+    topRepos: repositories(first: 1, ownerAffiliations: OWNER, privacy: PUBLIC,
+                           orderBy: {field: STARGAZERS, direction: DESC}) {
+      nodes { stargazerCount }
+    }
+    sponsorshipsAsSponsor { totalCount }
+    repositoryDiscussionComments(onlyAnswers: true) { totalCount }
+  }
+}
+"""
+
+# Only the fields each count needs, for the per-badge fallback
+MERGED_PRS_QUERY = """
+query($query: String!) {
+  search(query: $query, type: ISSUE, first: 100) {
+    issueCount
+    nodes { ... on PullRequest { repository { nameWithOwner } } }
+  }
+}
+"""
+MAX_STARS_QUERY = """
+query {
+  viewer {
+    repositories(first: 1, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: STARGAZERS, direction: DESC}) {
+      nodes { stargazerCount }
+    }
+  }
+}
+"""
+SPONSORSHIPS_QUERY = """
+query {
+  viewer { sponsorshipsAsSponsor { totalCount } }
+}
+"""
+DISCUSSION_ANSWERS_QUERY = """
+query {
+  viewer { repositoryDiscussionComments(onlyAnswers: true) { totalCount } }
+}
+"""
 
 class BadgeTracker:
-    def __init__(self, token: str):
-        self.github = Github(token)
+    def __init__(self, token: str, use_cache: bool = True):
         self.token = token
-        self.user = self.github.get_user()
+        self.login = get_login(token)
+        self.use_cache = use_cache
+        self._skip_cached_counts = False  # Set while a refresh is running
+        self._merged_pr_search = None  # Shared by the two merged-PR counts
+        self._merged_pr_lock = threading.Lock()
         
         # Badge definitions with requirements
         self.badges = {
@@ -73,48 +138,124 @@ class BadgeTracker:
             }
         }
         
+        # Tiers never change, so sort them by requirement once up front
+        for badge_info in self.badges.values():
+            sorted_tiers = sorted(badge_info["tiers"].items(), key=lambda x: x[1])
+            badge_info["_tier_names"] = [tier for tier, _ in sorted_tiers]
+            badge_info["_thresholds"] = [requirement for _, requirement in sorted_tiers]
+        
+    def _cached_count(self, method_name: str) -> Optional[int]:
+        """Return a count saved by an earlier run within the cache TTL"""
+        if not self.use_cache or self._skip_cached_counts:
+            return None
+        return read_cache(COUNT_CACHE_FILE, f"{self.login}:{method_name}", COUNT_CACHE_TTL)
+        
+    def _save_count(self, method_name: str, count: int):
+        """Save a successfully fetched count for later runs"""
+        write_cache(COUNT_CACHE_FILE, f"{self.login}:{method_name}", count)
+        
     def count_merged_prs(self) -> int:
         """Count merged pull requests by the user"""
+        count = self._cached_count("count_merged_prs")
+        if count is not None:
+            return count
+            
         count = 0
         try:
-            # Search for merged PRs by this user
-            query = f"type:pr author:{self.user.login} is:merged"
-            prs = self.github.search_issues(query)
-            count = prs.totalCount
+            try:
+                count = self._get_merged_prs()["issueCount"]
+            except Exception as e:
+                print(f"{Fore.YELLOW}GraphQL query failed ({e}), falling back to REST search")
+                # Search for merged PRs by this user; only the total is needed
+                query = f"type:pr author:{self.login} is:merged"
+                response = rest_get(self.token, "/search/issues", {"q": query, "per_page": 1})
+                count = json_loads(response.content)["total_count"]
+            self._save_count("count_merged_prs", count)
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not count merged PRs: {e}")
         return count
         
     def count_repos_with_merged_prs(self) -> int:
         """Count repositories where user has merged PRs"""
-        repos = set()
-        try:
-            query = f"type:pr author:{self.user.login} is:merged"
-            prs = self.github.search_issues(query)
+        cached = self._cached_count("count_repos_with_merged_prs")
+        if cached is not None:
+            return cached
             
-            # Get first 100 PRs to check repos (API limitation)
-            for pr in prs[:100]:
-                if hasattr(pr, 'repository'):
-                    repos.add(pr.repository.full_name)
-                    
+        count = 0
+        try:
+            try:
+                count = self._repos_with_merged_prs_graphql()
+            except Exception as e:
+                print(f"{Fore.YELLOW}GraphQL query failed ({e}), falling back to REST search")
+                count = self._repos_with_merged_prs_rest()
+            self._save_count("count_repos_with_merged_prs", count)
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not count repositories with merged PRs: {e}")
             
-        return len(repos)
+        return count
+        
+    def _get_merged_prs(self) -> Dict:
+        """Run the merged-PR search once per check and share it between both counts"""
+        with self._merged_pr_lock:
+            if self._merged_pr_search is None:
+                self._merged_pr_search = graphql(self.token, MERGED_PRS_QUERY, {
+                    "query": f"type:pr author:{self.login} is:merged"
+                })["search"]
+            return self._merged_pr_search
+            
+    def _repos_with_merged_prs_graphql(self) -> int:
+        """Count distinct repositories across the first 100 merged PRs via GraphQL"""
+        return len({
+            node["repository"]["nameWithOwner"]
+            for node in self._get_merged_prs()["nodes"] if node and node.get("repository")
+        })
+        
+    def _repos_with_merged_prs_rest(self) -> int:
+        """Count distinct repositories across the first 100 merged PRs via REST search"""
+        query = f"type:pr author:{self.login} is:merged"
+        results, _ = conditional_get(self.token, "/search/issues", {"q": query, "per_page": 100})
+        
+        # Get first 100 PRs to check repos (API limitation)
+        return len({item["repository_url"] for item in results["items"]})
         
     def count_max_stars(self) -> int:
         """Find the repository with the most stars"""
+        cached = self._cached_count("count_max_stars")
+        if cached is not None:
+            return cached
+            
         max_stars = 0
         try:
-            repos = self.user.get_repos(type='owner')
-            for repo in repos:
-                if not repo.private and repo.stargazers_count > max_stars:
-                    max_stars = repo.stargazers_count
+            try:
+                max_stars = self._max_stars_graphql()
+            except Exception as e:
+                print(f"{Fore.YELLOW}GraphQL query failed ({e}), falling back to REST listing")
+                max_stars = self._max_stars_rest()
+            self._save_count("count_max_stars", max_stars)
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not count stars: {e}")
             
         return max_stars
         
+    def _max_stars_graphql(self) -> int:
+        """Read the star count of the most starred public repo via GraphQL"""
+        # Ordered by stars, so the first node is the answer
+        nodes = graphql(self.token, MAX_STARS_QUERY)["viewer"]["repositories"]["nodes"]
+        return nodes[0]["stargazerCount"] if nodes else 0
+        
+    def _max_stars_rest(self) -> int:
+        """Find the most starred public repo by paging through the REST listing"""
+        max_stars = 0
+        url = "/user/repos"
+        params = {"affiliation": "owner", "visibility": "public", "per_page": 100}
+        while url:
+            repos, next_url = conditional_get(self.token, url, params)
+            for repo in repos:
+                max_stars = max(max_stars, repo["stargazers_count"])
+            # The next link already carries the query parameters
+            url, params = next_url, None
+        return max_stars
+        
     def check_quickdraw(self) -> int:
         """Check for quickdraw achievements (simplified check)"""
         # This is a simplified check - real implementation would need detailed timing analysis
@@ -128,10 +269,21 @@ class BadgeTracker:
         return 0  # Cannot reliably detect without repo-by-repo analysis
         
     def count_discussion_answers(self) -> int:
-        """Count discussion answers (simplified check)"""
-        # GitHub Discussions API access is limited
-        print(f"{Fore.YELLOW}Note: Discussion answer counting requires Discussions API access")
-        return 0  # Cannot reliably detect without specific API endpoints
+        """Count discussion comments marked as the accepted answer"""
+        cached = self._cached_count("count_discussion_answers")
+        if cached is not None:
+            return cached
+            
+        # Discussions are GraphQL-only, so there is no REST fallback
+        count = 0
+        try:
+            data = graphql(self.token, DISCUSSION_ANSWERS_QUERY)
+            count = data["viewer"]["repositoryDiscussionComments"]["totalCount"]
+            self._save_count("count_discussion_answers", count)
+        except Exception as e:
+            print(f"{Fore.YELLOW}Warning: Could not count discussion answers: {e}")
+            
+        return count
         
     def check_yolo_merges(self) -> int:
         """Check for YOLO merges (simplified check)"""
@@ -139,53 +291,66 @@ class BadgeTracker:
         return 0  # Cannot reliably detect without detailed review analysis
         
     def check_sponsorships(self) -> int:
-        """Check for GitHub sponsorships"""
-        print(f"{Fore.YELLOW}Note: Sponsorship data is private and cannot be checked via API")
-        return 0  # Sponsorship data is private
+        """Count the sponsorships the user has made"""
+        cached = self._cached_count("check_sponsorships")
+        if cached is not None:
+            return cached
+            
+        # Sponsorships are GraphQL-only, so there is no REST fallback
+        count = 0
+        try:
+            data = graphql(self.token, SPONSORSHIPS_QUERY)
+            count = data["viewer"]["sponsorshipsAsSponsor"]["totalCount"]
+            self._save_count("check_sponsorships", count)
+        except Exception as e:
+            print(f"{Fore.YELLOW}Warning: Could not count sponsorships: {e}")
+            
+        return count
+        
+    def get_badge_progress(self, refresh: bool = False) -> Dict:
+        """Get progress for all badges, fetching fresh counts when refresh is set"""
+        # A refresh must not be answered from the on-disk count cache
+        self._skip_cached_counts = refresh
+        try:
+            return self._check_badges()
+        finally:
+            self._skip_cached_counts = False
         
-    def get_badge_progress(self) -> Dict:
-        """Get progress for all badges"""
+    def _check_badges(self) -> Dict:
+        """Fetch counts and work out progress for every badge"""
         progress = {}
+        self._merged_pr_search = None
         
-        print(f"{Fore.CYAN}Analyzing badge progress for {self.user.login}...")
+        print(f"{Fore.CYAN}Analyzing badge progress for {self.login}...")
         print(f"{Fore.YELLOW}Note: Some badges require manual verification due to API limitations")
         print()
         
-        for badge_name, badge_info in self.badges.items():
+        try:
+            return self.build_progress(self.fetch_counts())
+        except Exception as e:
+            print(f"{Fore.YELLOW}GraphQL progress query failed ({e}), falling back to per-badge checks")
+            
+        # The checks are independent network calls, so overlap them. A small
+        # pool stays clear of GitHub's secondary rate limits.
+        for badge_name in self.badges:
             print(f"{Fore.MAGENTA}Checking {badge_name}...")
             
-            try:
+        # Badges sharing a check method (Heart On Your Sleeve and Pull Shark)
+        # run it once
+        futures = {}
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            for badge_info in self.badges.values():
                 method_name = badge_info["check_method"]
-                if hasattr(self, method_name):
-                    current_count = getattr(self, method_name)()
-                else:
-                    current_count = 0
-                    
-                # Determine tier achieved
-                achieved_tier = None
-                for tier, requirement in sorted(badge_info["tiers"].items(), 
-                                              key=lambda x: x[1]):
-                    if current_count >= requirement:
-                        achieved_tier = tier
-                        
-                progress[badge_name] = {
-                    "current": current_count,
-                    "achieved_tier": achieved_tier,
-                    "next_requirement": None,
-                    "description": badge_info["description"],
-                    "tiers": badge_info["tiers"]
-                }
+                if method_name not in futures:
+                    method = getattr(self, method_name, None)
+                    futures[method_name] = executor.submit(method) if method else None
                 
-                # Find next requirement
-                for tier, requirement in sorted(badge_info["tiers"].items(), 
-                                              key=lambda x: x[1]):
-                    if current_count < requirement:
-                        progress[badge_name]["next_requirement"] = {
-                            "tier": tier,
-                            "count": requirement,
-                            "needed": requirement - current_count
-                        }
-                        break
+        # Collect in badge order so reports stay stable
+        for badge_name, badge_info in self.badges.items():
+            try:
+                future = futures[badge_info["check_method"]]
+                current_count = future.result() if future else 0
+                progress[badge_name] = self._badge_progress(badge_info, current_count)
                         
             except Exception as e:
                 print(f"{Fore.RED}Error checking {badge_name}: {e}")
@@ -200,12 +365,73 @@ class BadgeTracker:
                 
         return progress
         
+    def fetch_counts(self) -> Dict[str, int]:
+        """Fetch every API-backed count with one GraphQL request, keyed by check method"""
+        cached = {name: self._cached_count(name) for name in BATCH_COUNT_METHODS}
+        if None not in cached.values():
+            return cached
+            
+        data = graphql(self.token, PROGRESS_QUERY, {
+            "mergedQuery": f"type:pr author:{self.login} is:merged"
+        })
+        
+        merged_prs = data["mergedPRs"]
+        viewer = data["viewer"]
+        top_repos = viewer["topRepos"]["nodes"]
+        
+        counts = {
+            "count_merged_prs": merged_prs["issueCount"],
+            "count_repos_with_merged_prs": len({
+                node["repository"]["nameWithOwner"]
+                for node in merged_prs["nodes"] if node and node.get("repository")
+            }),
+            "count_max_stars": top_repos[0]["stargazerCount"] if top_repos else 0,
+            "check_sponsorships": viewer["sponsorshipsAsSponsor"]["totalCount"],
+            "count_discussion_answers": viewer["repositoryDiscussionComments"]["totalCount"]
+        }
+        for name, count in counts.items():
+            self._save_count(name, count)
+        return counts
+        
+    def build_progress(self, counts: Dict[str, int]) -> Dict:
+        """Build badge progress from counts keyed by check method name"""
+        return {
+            badge_name: self._badge_progress(badge_info, counts.get(badge_info["check_method"], 0))
+            for badge_name, badge_info in self.badges.items()
+        }
+        
+    def _badge_progress(self, badge_info: Dict, current_count: int) -> Dict:
+        """Work out achieved and next tier for a single badge"""
+        
+        # Index of the highest threshold met; the one after it is next
+        names = badge_info["_tier_names"]
+        thresholds = badge_info["_thresholds"]
+        idx = bisect.bisect_right(thresholds, current_count) - 1
+        achieved_tier = names[idx] if idx >= 0 else None
+        
+        next_requirement = None
+        if idx + 1 < len(thresholds):
+            requirement = thresholds[idx + 1]
+            next_requirement = {
+                "tier": names[idx + 1],
+                "count": requirement,
+                "needed": requirement - current_count
+            }
+            
+        return {
+            "current": current_count,
+            "achieved_tier": achieved_tier,
+            "next_requirement": next_requirement,
+            "description": badge_info["description"],
+            "tiers": badge_info["tiers"]
+        }
+        
     def generate_progress_report(self, progress: Dict) -> str:
         """Generate a formatted progress report"""
         
         report_lines = [
             f"{Fore.GREEN}🏆 GitHub Achievement Badge Progress Report",
-            f"{Fore.CYAN}User: {self.user.login}",
+            f"{Fore.CYAN}User: {self.login}",
             f"{Fore.CYAN}Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             "",
         ]
@@ -244,9 +470,7 @@ class BadgeTracker:
             
         # Format table
         headers = ["Status", "Badge", "Current", "Tier", "Next Goal"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
-        
-        report_lines.append(table)
+        report_lines.append(self._format_table(headers, table_data))
         report_lines.append("")
         
         # Add detailed breakdown
@@ -281,18 +505,55 @@ class BadgeTracker:
             report_lines.append("")
             
         return "\n".join(report_lines)
+        
+    def _format_table(self, headers: List[str], rows: List[List]) -> str:
+        """Render rows as a fixed-width grid, numeric columns right-aligned"""
+        cells = [[str(cell) for cell in row] for row in [headers] + rows]
+        widths = [max(_display_width(row[i]) for row in cells) for i in range(len(headers))]
+        numeric = [
+            bool(rows) and all(isinstance(row[i], int) for row in rows)
+            for i in range(len(headers))
+        ]
+        
+        def pad(text: str, width: int, right: bool) -> str:
+            # Pad by terminal columns so wide emoji cells line up
+            padding = " " * (width - _display_width(text))
+            return padding + text if right else text + padding
+            
+        def line(fill: str) -> str:
+            return "+" + "+".join(fill * (width + 2) for width in widths) + "+"
+            
+        def row_line(row: List[str]) -> str:
+            return "| " + " | ".join(map(pad, row, widths, numeric)) + " |"
+            
+        separator = line("-")
+        lines = [separator, row_line(cells[0]), line("=")]
+        for row in cells[1:]:
+            lines.append(row_line(row))
+            lines.append(separator)
+        return "\n".join(lines)
+
+def _display_width(text: str) -> int:
+    """Terminal columns a string takes up; wide characters such as emoji take two"""
+    width = 0
+    for char in text:
+        if unicodedata.combining(char) or char == "\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
 
 @click.group()
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar=TOKEN_ENV_VARS, help='GitHub personal access token')
+@click.option('--refresh', is_flag=True, help='Ignore counts cached within the last hour')
 @click.pass_context
-def cli(ctx, token):
+def cli(ctx, token, refresh):
     """Badge Tracker for GitHub Achievement Badges"""
     if not token:
-        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --token")
+        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN (or BADGE_CLI_GITHUB_TOKEN) or use --token")
         sys.exit(1)
         
     ctx.ensure_object(dict)
-    ctx.obj['tracker'] = BadgeTracker(token)
+    ctx.obj['tracker'] = BadgeTracker(token, use_cache=not refresh)
 
 @cli.command()
 @click.option('--output', type=click.Path(), help='Save report to file')
@@ -326,7 +587,7 @@ def summary(ctx):
     tracker = ctx.obj['tracker']
     progress = tracker.get_badge_progress()
     
-    print(f"{Fore.GREEN}📊 Quick Badge Summary for {tracker.user.login}")
+    print(f"{Fore.GREEN}📊 Quick Badge Summary for {tracker.login}")
     print()
     
     achieved = 0
@@ -10,43 +10,41 @@ import os
 import sys
 import click
 import re
-from colorama import init, Fore, Style
 from typing import List, Dict, Optional
 
-init(autoreset=True)
+from colors import Fore, Style
 
 class CoAuthorHelper:
-    def __init__(self):
-        self.coauthor_template = "Co-authored-by: {name} <{email}>"
-        
+    # Compiled once; \Z rather than $ so a trailing newline cannot slip through
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+    
     def validate_email(self, email: str) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return self._EMAIL_RE.match(email) is not None
         
     def generate_coauthor_line(self, name: str, email: str) -> str:
         """Generate a co-author line for commit messages"""
         if not self.validate_email(email):
             raise ValueError(f"Invalid email format: {email}")
             
-        return self.coauthor_template.format(name=name, email=email)
+        return f"Co-authored-by: {name} <{email}>"
         
     def create_commit_message(self, title: str, description: str = "", coauthors: List[Dict] = None) -> str:
         """Create a properly formatted commit message with co-authors"""
         
-        message_parts = [title]
+        message = title
         
         if description:
-            message_parts.append("")  # Empty line
-            message_parts.append(description)
+            message += f"\n\n{description}"
             
         if coauthors:
-            message_parts.append("")  # Empty line before co-authors
-            for author in coauthors:
-                coauthor_line = self.generate_coauthor_line(author['name'], author['email'])
-                message_parts.append(coauthor_line)
-                
-        return "\n".join(message_parts)
+            # Blank line before the co-author trailers
+            message += "\n\n" + "\n".join(
+                self.generate_coauthor_line(author['name'], author['email'])
+                for author in coauthors
+            )
+            
+        return message
         
     def find_github_collaborators(self, username: str) -> List[str]:
         """Get suggested GitHub usernames for collaboration"""
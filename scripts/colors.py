@@ -0,0 +1,20 @@
+"""
+Terminal Colours
+
+Shared colour setup for the badge scripts. On a terminal colorama is
+initialised once; logs and pipes get plain text, with the colour codes
+blanked here rather than having colorama wrap stdout and strip them from
+every write.
+"""
+
+import sys
+from types import SimpleNamespace
+
+from colorama import init, Fore, Style
+
+if sys.stdout.isatty():
+    init(autoreset=True)
+else:
+    # Blank every colorama name, so any colour a script uses works when piped
+    Fore = SimpleNamespace(**{name: "" for name in vars(Fore)})
+    Style = SimpleNamespace(**{name: "" for name in vars(Style)})
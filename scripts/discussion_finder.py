@@ -9,24 +9,144 @@ Galaxy Brain: Answer a discussion (get an accepted answer) - 2, 8, 16, 32 for ti
 import os
 import sys
 import click
-import requests
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from datetime import datetime, timedelta
-from github import Github
-from colorama import init, Fore, Style
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 import json
 
-init(autoreset=True)
+from github_client import (
+    PER_PAGE, TOKEN_ENV_VARS, GraphQLError, count_items, get_login, graphql,
+    search_repositories
+)
+from colors import Fore, Style
+
+DISCUSSION_BATCH_SIZE = 50  # Repositories probed per GraphQL request
+PROBE_WORKERS = 10  # Concurrent REST probes when the batch falls short
+ETAG_TTL = 10 * 60  # Revalidate probed listings with their ETag for this long
+DESCRIPTION_LENGTH = 80  # Descriptions are only ever shown this long
+
+# Everything a result row needs, read alongside the discussions flag
+DISCUSSION_PROBE_FRAGMENT = """
+fragment DiscussionProbe on Repository {
+  hasDiscussionsEnabled
+  discussions { totalCount }
+  stargazerCount
+  primaryLanguage { name }
+  description
+  url
+  repositoryTopics(first: 3) { nodes { topic { name } } }
+}
+"""
+
+# Discussions are only searchable through GraphQL; REST search/issues
+# does not index them
+UNANSWERED_DISCUSSIONS_QUERY = """
+query($query: String!, $first: Int!, $after: String) {
+  search(query: $query, type: DISCUSSION, first: $first, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Discussion {
+        title
+        url
+        createdAt
+        comments { totalCount }
+        category { name }
+        repository { nameWithOwner }
+      }
+    }
+  }
+}
+"""
+
+# One find_repos listing entry, with the colour codes resolved once
+REPO_ROW_TEMPLATE = (
+    f"{Fore.CYAN}{{i:2d}}. {{name}}{Style.RESET_ALL}\n"
+    "    ⭐ {stars} stars | 💻 {language}\n"
+    "    📝 {description}...\n"
+    "{topics}"
+    "    💬 Discussions: {discussions_url}\n"
+)
+
+# Static content, built once at import rather than on every call
+DISCUSSION_CATEGORIES = (
+    "Q&A",
+    "General", 
+    "Ideas",
+    "Show and tell",
+    "Help",
+    "Support",
+    "Feature requests",
+    "Announcements",
+    "Discussions"
+)
+
+RESPONSE_TEMPLATES = MappingProxyType({
+    "troubleshooting": (
+        "Have you tried checking the logs for error messages?",
+        "Could you share your configuration file (with sensitive data removed)?",
+        "This looks like a version compatibility issue. What version are you using?",
+        "I've seen this before. Try clearing your cache and restarting.",
+        "Check if you have the required dependencies installed.",
+        "Make sure your environment variables are set correctly.",
+        "This might be related to file permissions. Can you check that?",
+        "Try running in verbose mode to see more detailed output."
+    ),
+    "feature_requests": (
+        "This is an interesting idea! Have you considered the impact on existing users?",
+        "You might want to check if there are any existing issues or PRs for this.",
+        "This could be implemented as a plugin/extension first.",
+        "Consider creating a minimal working example to demonstrate the need.",
+        "Have you looked at how other similar projects handle this?",
+        "This would need careful documentation and migration guides.",
+        "Consider the performance implications of this change."
+    ),
+    "general_help": (
+        "Welcome to the community! Here are some resources to get started:",
+        "The documentation covers this topic in section X.",
+        "You might find the examples in the repository helpful.",
+        "Check out the FAQ for common questions like this.",
+        "The community chat/Discord might be helpful for real-time help.",
+        "Consider searching existing issues for similar problems.",
+        "Make sure you're using the latest version before reporting bugs."
+    ),
+    "best_practices": (
+        "Here's the recommended approach for this use case:",
+        "Consider following the project's coding standards for consistency.",
+        "Make sure to include tests for any new functionality.",
+        "Documentation updates are always appreciated alongside code changes.",
+        "Consider the security implications of this approach.",
+        "Performance testing would be valuable for this change.",
+        "Make sure to handle edge cases and error conditions."
+    )
+})
+
+GENERAL_TOPICS = (
+    "getting-started", "documentation", "api", "configuration",
+    "deployment", "testing", "performance", "security", "best-practices",
+    "migration", "troubleshooting", "examples", "tutorials"
+)
+
+LANGUAGE_TOPICS = MappingProxyType({
+    "Python": ("pip", "virtualenv", "django", "flask", "pytest", "packaging"),
+    "JavaScript": ("npm", "webpack", "react", "vue", "node", "typescript"),
+    "Java": ("maven", "gradle", "spring", "junit", "deployment"),
+    "Go": ("modules", "testing", "concurrency", "performance"),
+    "Rust": ("cargo", "ownership", "async", "performance"),
+    "C++": ("cmake", "memory", "performance", "compilation"),
+    "Ruby": ("gem", "rails", "bundler", "testing")
+})
 
 class DiscussionFinder:
     def __init__(self, token: str):
-        self.github = Github(token)
         self.token = token
-        self.user = self.github.get_user()
-        self.headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        
+    @cached_property
+    def login(self) -> str:
+        """The authenticated user's login, looked up only when a command needs it"""
+        return get_login(self.token)
         
     def search_repositories_with_discussions(self, 
                                            topic: Optional[str] = None,
@@ -48,130 +168,175 @@ class DiscussionFinder:
         
         repos_with_discussions = []
         try:
-            search_result = self.github.search_repositories(search_query, sort="updated")
+            candidates = search_repositories(self.token, search_query, max_results * 2)  # Get more to filter
             
-            for repo in search_result[:max_results * 2]:  # Get more to filter
-                # Check if discussions are enabled (GitHub API doesn't directly expose this)
-                # We'll use a heuristic approach
-                try:
-                    # Try to access discussions endpoint
-                    discussions_url = f"https://api.github.com/repos/{repo.full_name}/discussions"
-                    response = requests.get(discussions_url, headers=self.headers)
+            for start in range(0, len(candidates), DISCUSSION_BATCH_SIZE):
+                batch = candidates[start:start + DISCUSSION_BATCH_SIZE]
+                nodes = self._probe_discussions_batch(batch)
+                
+                # Repos the batch could not read are probed directly, in
+                # parallel; the cap keeps clear of secondary rate limits
+                missing = [repo for repo, node in zip(batch, nodes) if node is None]
+                with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+                    rest_entries = dict(zip(
+                        (repo["full_name"] for repo in missing),
+                        executor.map(self._probe_discussions_rest, missing)
+                    ))
                     
-                    if response.status_code == 200:
-                        discussions_data = response.json()
-                        
-                        repos_with_discussions.append({
-                            'name': repo.full_name,
-                            'description': repo.description or "No description",
-                            'stars': repo.stargazers_count,
-                            'language': repo.language,
-                            'url': repo.html_url,
-                            'discussions_url': f"{repo.html_url}/discussions",
-                            'topics': list(repo.get_topics())[:3],  # First 3 topics
-                            'open_discussions': len(discussions_data) if isinstance(discussions_data, list) else 0
-                        })
+                for repo, node in zip(batch, nodes):
+                    if node is None:
+                        entry = rest_entries[repo["full_name"]]
+                    elif node["hasDiscussionsEnabled"]:
+                        entry = self._repo_entry(repo["full_name"], node)
+                    else:
+                        entry = None
                         
+                    if entry:
+                        repos_with_discussions.append(entry)
                         if len(repos_with_discussions) >= max_results:
-                            break
+                            return repos_with_discussions
                             
-                except Exception:
-                    continue  # Skip repos where we can't access discussions
-                    
         except Exception as e:
             print(f"{Fore.RED}Error searching repositories: {e}")
             
         return repos_with_discussions
         
-    def get_discussion_categories(self) -> List[str]:
-        """Get common discussion categories to look for"""
-        return [
-            "Q&A",
-            "General", 
-            "Ideas",
-            "Show and tell",
-            "Help",
-            "Support",
-            "Feature requests",
-            "Announcements",
-            "Discussions"
-        ]
+    def _probe_discussions_batch(self, repos: List[Dict]) -> List[Optional[Dict]]:
+        """Read discussion status for many repositories in one GraphQL request
         
-    def generate_helpful_responses(self) -> Dict[str, List[str]]:
-        """Generate templates for helpful discussion responses"""
+        Returns one node per repository, or None where the batch failed for it.
+        """
+        declarations = []
+        fields = []
+        variables = {}
+        for i, repo in enumerate(repos):
+            owner, name = repo["full_name"].split("/", 1)
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+            declarations.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"repo{i}: repository(owner: $o{i}, name: $n{i}) {{ ...DiscussionProbe }}")
+            
+        body = "\n  ".join(fields)
+        query = f"query({', '.join(declarations)}) {{\n  {body}\n}}\n{DISCUSSION_PROBE_FRAGMENT}"
+        try:
+            data = graphql(self.token, query, variables)
+        except GraphQLError as e:
+            # Per-repository errors leave their alias null; keep the rest
+            data = e.data or {}
+        except Exception as e:
+            print(f"{Fore.YELLOW}GraphQL discussion probe failed ({e}), falling back to REST")
+            return [None] * len(repos)
+            
+        return [data.get(f"repo{i}") for i in range(len(repos))]
         
+    def _repo_entry(self, full_name: str, node: Dict) -> Dict:
+        """Build a result row from a GraphQL repository node"""
         return {
-            "troubleshooting": [
-                "Have you tried checking the logs for error messages?",
-                "Could you share your configuration file (with sensitive data removed)?",
-                "This looks like a version compatibility issue. What version are you using?",
-                "I've seen this before. Try clearing your cache and restarting.",
-                "Check if you have the required dependencies installed.",
-                "Make sure your environment variables are set correctly.",
-                "This might be related to file permissions. Can you check that?",
-                "Try running in verbose mode to see more detailed output."
-            ],
-            "feature_requests": [
-                "This is an interesting idea! Have you considered the impact on existing users?",
-                "You might want to check if there are any existing issues or PRs for this.",
-                "This could be implemented as a plugin/extension first.",
-                "Consider creating a minimal working example to demonstrate the need.",
-                "Have you looked at how other similar projects handle this?",
-                "This would need careful documentation and migration guides.",
-                "Consider the performance implications of this change."
-            ],
-            "general_help": [
-                "Welcome to the community! Here are some resources to get started:",
-                "The documentation covers this topic in section X.",
-                "You might find the examples in the repository helpful.",
-                "Check out the FAQ for common questions like this.",
-                "The community chat/Discord might be helpful for real-time help.",
-                "Consider searching existing issues for similar problems.",
-                "Make sure you're using the latest version before reporting bugs."
-            ],
-            "best_practices": [
-                "Here's the recommended approach for this use case:",
-                "Consider following the project's coding standards for consistency.",
-                "Make sure to include tests for any new functionality.",
-                "Documentation updates are always appreciated alongside code changes.",
-                "Consider the security implications of this approach.",
-                "Performance testing would be valuable for this change.",
-                "Make sure to handle edge cases and error conditions."
-            ]
+            'name': full_name,
+            'description': (node["description"] or "No description")[:DESCRIPTION_LENGTH],
+            'stars': node["stargazerCount"],
+            'language': (node["primaryLanguage"] or {}).get("name"),
+            'url': node["url"],
+            'discussions_url': f"{node['url']}/discussions",
+            'topics': [topic["topic"]["name"] for topic in node["repositoryTopics"]["nodes"]],
+            'open_discussions': node["discussions"]["totalCount"]
         }
         
-    def suggest_discussion_topics(self, language: str = None) -> List[str]:
-        """Suggest topics to look for in discussions"""
+    def _probe_discussions_rest(self, repo: Dict) -> Optional[Dict]:
+        """Probe a single repository's discussions endpoint over REST"""
+        # Check if discussions are enabled (GitHub API doesn't directly expose this)
+        # We'll use a heuristic approach
+        try:
+            # Try to access discussions endpoint; an unchanged listing comes
+            # back as a 304 that costs no rate limit. Errors mean no access.
+            open_discussions = count_items(
+                self.token, f"/repos/{repo['full_name']}/discussions", ttl=ETAG_TTL
+            )
+            
+            return {
+                'name': repo["full_name"],
+                'description': (repo["description"] or "No description")[:DESCRIPTION_LENGTH],
+                'stars': repo["stargazers_count"],
+                'language': repo["language"],
+                'url': repo["html_url"],
+                'discussions_url': f"{repo['html_url']}/discussions",
+                # Search results already carry topics; get_topics() would
+                # cost another request per repo
+                'topics': repo.get("topics", [])[:3],  # First 3 topics
+                'open_discussions': open_discussions
+            }
+            
+        except Exception:
+            pass  # Skip repos where we can't access discussions
+            
+        return None
         
-        general_topics = [
-            "getting-started", "documentation", "api", "configuration",
-            "deployment", "testing", "performance", "security", "best-practices",
-            "migration", "troubleshooting", "examples", "tutorials"
-        ]
+    def find_unanswered_discussions(self, language: str = None, topics: Tuple[str, ...] = (),
+                                    max_results: int = 20) -> List[Dict]:
+        """Search for unanswered discussions directly, one search per topic
         
-        language_specific = {
-            "Python": ["pip", "virtualenv", "django", "flask", "pytest", "packaging"],
-            "JavaScript": ["npm", "webpack", "react", "vue", "node", "typescript"],
-            "Java": ["maven", "gradle", "spring", "junit", "deployment"],
-            "Go": ["modules", "testing", "concurrency", "performance"],
-            "Rust": ["cargo", "ownership", "async", "performance"],
-            "C++": ["cmake", "memory", "performance", "compilation"],
-            "Ruby": ["gem", "rails", "bundler", "testing"]
-        }
+        Discussion search has no language or topic qualifiers, so both are
+        matched as keywords.
+        """
+        base_query = f"is:unanswered {language}" if language else "is:unanswered"
+        queries = [f"{base_query} {topic}" for topic in topics] or [base_query]
         
-        topics = general_topics.copy()
-        if language and language in language_specific:
-            topics.extend(language_specific[language])
-            
-        return topics
+        print(f"{Fore.CYAN}Searching for unanswered discussions...")
+        
+        results = []
+        for query in queries:
+            try:
+                # Search pages hold at most 100 nodes, so larger requests page
+                cursor = None
+                remaining = max_results
+                while remaining > 0:
+                    search = graphql(self.token, UNANSWERED_DISCUSSIONS_QUERY, {
+                        "query": query,
+                        "first": min(remaining, PER_PAGE),
+                        "after": cursor
+                    })["search"]
+                    results.append(search["nodes"])
+                    remaining -= len(search["nodes"])
+                    if not search["pageInfo"]["hasNextPage"]:
+                        break
+                    cursor = search["pageInfo"]["endCursor"]
+            except Exception as e:
+                print(f"{Fore.YELLOW}Warning: Could not search discussions for '{query}': {e}")
+                
+        # Topics overlap, so keep the first hit for each discussion
+        discussions = {}
+        for node in itertools.chain.from_iterable(results):
+            if node and node["url"] not in discussions:
+                discussions[node["url"]] = {
+                    'title': node["title"],
+                    'url': node["url"],
+                    'repository': node["repository"]["nameWithOwner"],
+                    'category': node["category"]["name"],
+                    'comments': node["comments"]["totalCount"],
+                    'created_at': node["createdAt"]
+                }
+                
+        return list(discussions.values())[:max_results]
+        
+    def get_discussion_categories(self) -> Tuple[str, ...]:
+        """Get common discussion categories to look for"""
+        return DISCUSSION_CATEGORIES
+        
+    def generate_helpful_responses(self) -> Mapping[str, Tuple[str, ...]]:
+        """Generate templates for helpful discussion responses"""
+        return RESPONSE_TEMPLATES
+        
+    def suggest_discussion_topics(self, language: str = None) -> Tuple[str, ...]:
+        """Suggest topics to look for in discussions"""
+        return GENERAL_TOPICS + LANGUAGE_TOPICS.get(language, ())
 
 @click.group()
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar=TOKEN_ENV_VARS, help='GitHub personal access token')
 @click.pass_context
 def cli(ctx, token):
     """Discussion Finder for Galaxy Brain Badge"""
     if not token:
-        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --token")
+        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN (or BADGE_CLI_GITHUB_TOKEN) or use --token")
         sys.exit(1)
         
     ctx.ensure_object(dict)
@@ -189,7 +354,7 @@ def find_repos(ctx, topic, language, min_stars, max_results):
     finder = ctx.obj['finder']
     
     print(f"{Fore.GREEN}🔍 Finding repositories with discussions enabled...")
-    print(f"{Fore.YELLOW}👤 Authenticated as: {finder.user.login}")
+    print(f"{Fore.YELLOW}👤 Authenticated as: {finder.login}")
     print()
     
     repos = finder.search_repositories_with_discussions(
@@ -204,24 +369,63 @@ def find_repos(ctx, topic, language, min_stars, max_results):
         print(f"{Fore.YELLOW}💡 Try different search criteria or lower the star threshold")
         return
         
-    print(f"{Fore.GREEN}✅ Found {len(repos)} repositories with discussions:")
-    print()
+    # Build the listing and write it once instead of a print per line
+    out = [f"{Fore.GREEN}✅ Found {len(repos)} repositories with discussions:{Style.RESET_ALL}", ""]
     
     for i, repo in enumerate(repos, 1):
-        print(f"{Fore.CYAN}{i:2d}. {repo['name']}")
-        print(f"    ⭐ {repo['stars']} stars | 💻 {repo['language'] or 'Mixed'}")
-        print(f"    📝 {repo['description'][:80]}...")
-        if repo['topics']:
-            print(f"    🏷️  Topics: {', '.join(repo['topics'])}")
-        print(f"    💬 Discussions: {repo['discussions_url']}")
-        print()
+        out.append(REPO_ROW_TEMPLATE.format(
+            i=i,
+            name=repo['name'],
+            stars=repo['stars'],
+            language=repo['language'] or 'Mixed',
+            description=repo['description'],
+            topics=f"    🏷️  Topics: {', '.join(repo['topics'])}\n" if repo['topics'] else "",
+            discussions_url=repo['discussions_url']
+        ))
+        
+    out.extend([
+        f"{Fore.MAGENTA}💡 Next Steps:{Style.RESET_ALL}",
+        "1. Visit the discussions pages of interesting repositories",
+        "2. Look for unanswered questions you can help with",
+        "3. Provide helpful, detailed answers",
+        "4. Wait for the discussion author to mark your answer as helpful",
+        "5. Repeat to earn higher badge tiers!"
+    ])
+    sys.stdout.write("\n".join(out) + "\n")
+
+@cli.command()
+@click.option('--language', help='Programming language keyword')
+@click.option('--topic', multiple=True, help='Topic keyword (repeat to search several)')
+@click.option('--max-results', default=20, help='Maximum number of discussions to show')
+@click.pass_context
+def find_unanswered(ctx, language, topic, max_results):
+    """Find unanswered discussions to help with"""
+    
+    finder = ctx.obj['finder']
+    
+    print(f"{Fore.GREEN}🔍 Finding unanswered discussions...")
+    print()
+    
+    discussions = finder.find_unanswered_discussions(
+        language=language,
+        topics=topic,
+        max_results=max_results
+    )
+    
+    if not discussions:
+        print(f"{Fore.RED}❌ No unanswered discussions found")
+        print(f"{Fore.YELLOW}💡 Try fewer or broader keywords")
+        return
         
-    print(f"{Fore.MAGENTA}💡 Next Steps:")
-    print("1. Visit the discussions pages of interesting repositories")
-    print("2. Look for unanswered questions you can help with")
-    print("3. Provide helpful, detailed answers")
-    print("4. Wait for the discussion author to mark your answer as helpful")
-    print("5. Repeat to earn higher badge tiers!")
+    out = [f"{Fore.GREEN}✅ Found {len(discussions)} unanswered discussions:{Style.RESET_ALL}", ""]
+    
+    for i, discussion in enumerate(discussions, 1):
+        out.append(f"{Fore.CYAN}{i:2d}. {discussion['title']}{Style.RESET_ALL}")
+        out.append(f"    📦 {discussion['repository']} | 📂 {discussion['category']} | 💬 {discussion['comments']} comments")
+        out.append(f"    🔗 {discussion['url']}")
+        out.append("")
+        
+    sys.stdout.write("\n".join(out) + "\n")
 
 @cli.command()
 @click.option('--category', help='Discussion category to focus on')
@@ -232,31 +436,33 @@ def response_templates(ctx, category):
     finder = ctx.obj['finder']
     responses = finder.generate_helpful_responses()
     
-    print(f"{Fore.GREEN}💬 Discussion Response Templates")
-    print()
+    out = [f"{Fore.GREEN}💬 Discussion Response Templates{Style.RESET_ALL}", ""]
     
     if category and category.lower().replace(' ', '_') in responses:
         cat_key = category.lower().replace(' ', '_')
-        print(f"{Fore.CYAN}📂 {category.title()} Responses:")
+        out.append(f"{Fore.CYAN}📂 {category.title()} Responses:{Style.RESET_ALL}")
         for i, template in enumerate(responses[cat_key], 1):
-            print(f"  {i}. {template}")
-        print()
+            out.append(f"  {i}. {template}")
+        out.append("")
     else:
         for cat_name, templates in responses.items():
-            print(f"{Fore.CYAN}📂 {cat_name.replace('_', ' ').title()}:")
+            out.append(f"{Fore.CYAN}📂 {cat_name.replace('_', ' ').title()}:{Style.RESET_ALL}")
             for i, template in enumerate(templates[:3], 1):  # Show first 3
-                print(f"  {i}. {template}")
+                out.append(f"  {i}. {template}")
             if len(templates) > 3:
-                print(f"     ... and {len(templates) - 3} more")
-            print()
+                out.append(f"     ... and {len(templates) - 3} more")
+            out.append("")
             
-    print(f"{Fore.YELLOW}💡 Tips for Galaxy Brain Badge:")
-    print("• Provide detailed, helpful answers")
-    print("• Include code examples when relevant")
-    print("• Link to documentation or resources")
-    print("• Be patient and supportive")
-    print("• Follow up if needed")
-    print("• Wait for the author to mark answers as helpful")
+    out.extend([
+        f"{Fore.YELLOW}💡 Tips for Galaxy Brain Badge:{Style.RESET_ALL}",
+        "• Provide detailed, helpful answers",
+        "• Include code examples when relevant",
+        "• Link to documentation or resources",
+        "• Be patient and supportive",
+        "• Follow up if needed",
+        "• Wait for the author to mark answers as helpful"
+    ])
+    sys.stdout.write("\n".join(out) + "\n")
 
 @cli.command()
 @click.option('--language', help='Programming language for specific topics')
@@ -268,26 +474,29 @@ def suggest_topics(ctx, language):
     topics = finder.suggest_discussion_topics(language)
     categories = finder.get_discussion_categories()
     
-    print(f"{Fore.GREEN}🎯 Suggested Discussion Topics")
-    print()
-    
-    print(f"{Fore.CYAN}📂 Common Discussion Categories:")
-    for cat in categories:
-        print(f"  • {cat}")
-    print()
+    out = [
+        f"{Fore.GREEN}🎯 Suggested Discussion Topics{Style.RESET_ALL}",
+        "",
+        f"{Fore.CYAN}📂 Common Discussion Categories:{Style.RESET_ALL}"
+    ]
+    out.extend(f"  • {cat}" for cat in categories)
+    out.append("")
     
-    print(f"{Fore.MAGENTA}🔍 Search Keywords:")
+    out.append(f"{Fore.MAGENTA}🔍 Search Keywords:{Style.RESET_ALL}")
     for i, topic in enumerate(topics, 1):
-        print(f"  {i:2d}. {topic}")
+        out.append(f"  {i:2d}. {topic}")
         if i % 10 == 0:  # Line break every 10 items
-            print()
+            out.append("")
             
-    print(f"\n{Fore.YELLOW}💡 Discussion Search Strategy:")
-    print("1. Look for questions tagged with these topics")
-    print("2. Focus on unanswered or partially answered discussions")
-    print("3. Choose topics you have expertise in")
-    print("4. Sort by 'recently updated' to find active discussions")
-    print("5. Read the full question before answering")
+    out.extend([
+        f"\n{Fore.YELLOW}💡 Discussion Search Strategy:{Style.RESET_ALL}",
+        "1. Look for questions tagged with these topics",
+        "2. Focus on unanswered or partially answered discussions",
+        "3. Choose topics you have expertise in",
+        "4. Sort by 'recently updated' to find active discussions",
+        "5. Read the full question before answering"
+    ])
+    sys.stdout.write("\n".join(out) + "\n")
 
 @cli.command()
 @click.pass_context
@@ -365,7 +574,7 @@ Answer a discussion and get it marked as helpful/accepted.
 • Quality over quantity - focus on helpful answers
 """
     
-    print(guide_text)
+    sys.stdout.write(guide_text + "\n")
 
 @cli.command()
 @click.pass_context
@@ -476,7 +685,7 @@ This structure scales well to 50+ developers and hundreds of components in my ex
 • Follow-up questions to help more
 """
     
-    print(examples_text)
+    sys.stdout.write(examples_text + "\n")
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -0,0 +1,333 @@
+"""
+GitHub Client Helpers
+
+Shared helpers for the badge scripts: a cached authenticated client and a
+small on-disk cache so repeat CLI runs skip redundant API calls.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import tempfile
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+try:
+    # C parser for the larger listing and search payloads
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+# A tool-specific token wins over the generic one, so the CLI can use a
+# different token than other tools reading GITHUB_TOKEN
+TOKEN_ENV_VARS = ["BADGE_CLI_GITHUB_TOKEN", "GITHUB_TOKEN"]
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "badge-cli")
+USER_CACHE_TTL = 24 * 60 * 60  # Logins practically never change
+ETAG_CACHE_FILE = "etags.json"
+SEARCH_CACHE_FILE = "searches.json"
+SEARCH_CACHE_TTL = 10 * 60  # Reruns with the same filters reuse the results
+PER_PAGE = 100  # GitHub's maximum page size
+CACHE_MAX_AGE = 7 * 24 * 60 * 60  # Entries untouched this long are deleted
+
+
+class GraphQLError(Exception):
+    """Raised when a GraphQL response contains errors"""
+
+    def __init__(self, errors: List[Dict], data: Optional[Dict] = None):
+        super().__init__("; ".join(error.get("message", str(error)) for error in errors))
+        self.errors = errors
+        self.data = data
+
+
+def get_token() -> Optional[str]:
+    """Return the GitHub token from the environment, if one is set"""
+    for name in TOKEN_ENV_VARS:
+        if os.environ.get(name):
+            return os.environ[name]
+    return None
+
+
+def token_key(token: str) -> str:
+    """Stable cache key for a token that never stores the token itself"""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _cache_path(namespace: str, key: str) -> str:
+    """File holding one cache entry; each key gets its own file under the namespace"""
+    directory = os.path.join(CACHE_DIR, os.path.splitext(namespace)[0])
+    return os.path.join(directory, hashlib.sha256(key.encode()).hexdigest()[:32] + ".json")
+
+
+def read_cache(namespace: str, key: str, ttl: float) -> Optional[Any]:
+    """Return a cached value if it exists and is younger than ttl seconds"""
+    try:
+        with open(_cache_path(namespace, key), "rb") as f:
+            entry = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get("timestamp", 0) > ttl:
+        return None
+    return entry.get("value")
+
+
+def write_cache(namespace: str, key: str, value: Any):
+    """Store a value in its own cache file, replacing it atomically"""
+    path = _cache_path(namespace, key)
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        _prune_cache_dir(directory)
+
+        # Readers only ever see the old file or the complete new one
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"timestamp": time.time(), "value": value}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # Caching is best effort
+
+
+@functools.lru_cache(maxsize=None)
+def _prune_cache_dir(directory: str):
+    """Delete entries nobody has refreshed in CACHE_MAX_AGE, once per directory per run"""
+    cutoff = time.time() - CACHE_MAX_AGE
+    try:
+        # Drop the single-file cache this directory replaced
+        if os.path.isfile(directory + ".json"):
+            os.unlink(directory + ".json")
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+class RateLimiter:
+    """requests response hook that backs off when GitHub signals rate limiting
+
+    Once the remaining budget drops below the threshold the calling thread
+    sleeps until the window resets. Throttled responses (429, or 403 with
+    Retry-After, an exhausted budget or a secondary rate limit message) are
+    retried after Retry-After, the reset time, or a jittered exponential
+    backoff.
+    """
+
+    def __init__(self, session, threshold: int = 10, max_retries: int = 5):
+        self.session = session
+        self.threshold = threshold
+        self.max_retries = max_retries
+
+    def __call__(self, response, *args, **kwargs):
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        throttled = response.status_code == 429 or (response.status_code == 403 and (
+            "Retry-After" in headers or remaining == "0" or "rate limit" in response.text.lower()
+        ))
+
+        if throttled:
+            attempt = getattr(response.request, "rate_limit_attempt", 0)
+            if attempt >= self.max_retries:
+                return response
+
+            if "Retry-After" in headers:
+                delay = float(headers["Retry-After"])
+            elif remaining == "0" and "X-RateLimit-Reset" in headers:
+                delay = self._until_reset(headers)
+            else:
+                # Jitter keeps parallel workers from retrying in lockstep
+                delay = 2 ** attempt + random.random()
+            self._sleep(delay, "GitHub rate limit hit")
+
+            request = response.request.copy()
+            request.rate_limit_attempt = attempt + 1
+            response.close()
+            return self.session.send(request, **kwargs)
+
+        if remaining is not None and int(remaining) < self.threshold and "X-RateLimit-Reset" in headers:
+            self._sleep(self._until_reset(headers), f"Only {remaining} GitHub API requests left")
+        return response
+
+    @staticmethod
+    def _until_reset(headers) -> float:
+        # One second of slack for clock skew
+        return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time()) + 1
+
+    @staticmethod
+    def _sleep(delay: float, reason: str):
+        print(f"{reason}, waiting {delay:.0f}s...", file=sys.stderr)
+        time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=4)
+def get_github(token: str):
+    """Return a shared authenticated Github client for this token"""
+    from github import Github, GithubRetry
+
+    # Full pages mean fewer round trips, and the pooled connections stay
+    # alive across calls and threads. GithubRetry also waits out
+    # secondary rate limits instead of failing.
+    return Github(
+        token,
+        per_page=PER_PAGE,
+        pool_size=10,
+        retry=GithubRetry(total=5, backoff_factor=0.5)
+    )
+
+
+def first_items(paginated, count: int) -> List:
+    """Return the first count items of a PaginatedList, in one request when they fit on a page"""
+    if count <= PER_PAGE:
+        return paginated.get_page(0)[:count]
+    return list(paginated[:count])
+
+
+def search_repositories(token: str, query: str, count: int, sort: str = "updated",
+                        ttl: float = SEARCH_CACHE_TTL) -> List[Dict]:
+    """Return the raw payloads of the first count repository search results
+
+    Results are cached on disk for ttl seconds. Raw payloads also sidestep
+    PyGithub attribute access, which can lazily fetch the full repository
+    for fields that are unset.
+    """
+    key = f"{token_key(token)} {sort} {count} {query}"
+    repos = read_cache(SEARCH_CACHE_FILE, key, ttl)
+    if repos is not None:
+        return repos
+
+    search_result = get_github(token).search_repositories(query, sort=sort)
+    repos = [repo._rawData for repo in first_items(search_result, count)]
+    write_cache(SEARCH_CACHE_FILE, key, repos)
+    return repos
+
+
+@functools.lru_cache(maxsize=4)
+def get_session(token: str):
+    """Return a shared keep-alive requests session for raw API calls"""
+    if not token:
+        # Unauthenticated calls are limited to 60 requests an hour
+        raise ValueError("GitHub token required. Set GITHUB_TOKEN or BADGE_CLI_GITHUB_TOKEN")
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"bearer {token}",
+        "Accept": "application/vnd.github+json"
+    })
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    session.hooks["response"].append(RateLimiter(session))
+    return session
+
+
+@functools.lru_cache(maxsize=4)
+def get_login(token: str) -> str:
+    """Return the authenticated user's login, cached on disk for a day"""
+    key = token_key(token)
+    login = read_cache("user.json", key, USER_CACHE_TTL)
+    if login:
+        return login
+
+    login = get_github(token).get_user().login
+    write_cache("user.json", key, login)
+    return login
+
+
+def graphql(token: str, query: str, variables: Optional[Dict] = None) -> Dict:
+    """Run a GraphQL query and return its data, raising GraphQLError on errors"""
+    response = get_session(token).post(
+        GRAPHQL_URL,
+        json={"query": query, "variables": variables or {}},
+        timeout=15
+    )
+    response.raise_for_status()
+
+    payload = json_loads(response.content)
+    if payload.get("errors"):
+        raise GraphQLError(payload["errors"], payload.get("data"))
+    return payload["data"]
+
+
+def rest_get(token: str, path: str, params: Optional[Dict] = None):
+    """GET a REST endpoint on the shared session and return the raw response"""
+    url = path if path.startswith("https://") else f"{API_URL}{path}"
+    response = get_session(token).get(url, params=params, timeout=15)
+    response.raise_for_status()
+    return response
+
+
+def rest_send(token: str, method: str, path: str, payload: Dict) -> Any:
+    """Send a JSON body to a REST endpoint on the shared session and return the reply"""
+    url = path if path.startswith("https://") else f"{API_URL}{path}"
+    response = get_session(token).request(method, url, json=payload, timeout=15)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+def conditional_get(token: str, path: str, params: Optional[Dict] = None,
+                    ttl: float = float("inf")) -> Tuple[Any, Optional[str]]:
+    """GET a REST endpoint with its last ETag, returning the JSON and next page URL
+
+    A 304 Not Modified reply does not count against the rate limit, so
+    unchanged responses are served from the body stored alongside the ETag.
+    Stored ETags older than ttl seconds are not sent.
+    """
+    data, links = _conditional_get(token, path, params, ttl)
+    return data, links.get("next")
+
+
+def count_items(token: str, path: str, params: Optional[Dict] = None,
+                ttl: float = float("inf")) -> int:
+    """Count the items of a REST listing without downloading them
+
+    With one item per page, the page number of the rel="last" link is the
+    total, so only a single item's body is transferred.
+    """
+    data, links = _conditional_get(token, path, dict(params or {}, per_page=1), ttl)
+    if "last" in links:
+        return int(parse_qs(urlparse(links["last"]).query)["page"][0])
+    return len(data) if isinstance(data, list) else 0
+
+
+def _conditional_get(token: str, path: str, params: Optional[Dict],
+                     ttl: float) -> Tuple[Any, Dict[str, str]]:
+    """ETag-aware GET returning the JSON and the Link header URLs by rel"""
+    url = path if path.startswith("https://") else f"{API_URL}{path}"
+    key = f"{token_key(token)} {url}?{urlencode(sorted((params or {}).items()))}"
+    cached = read_cache(ETAG_CACHE_FILE, key, ttl)
+    if cached and "links" not in cached:
+        cached = None  # Stored before Link URLs were kept
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+
+    response = get_session(token).get(url, params=params, headers=headers, timeout=15)
+    if response.status_code == 304 and cached:
+        return cached["data"], cached["links"]
+    response.raise_for_status()
+
+    data = json_loads(response.content)
+    links = {rel: link["url"] for rel, link in response.links.items()}
+    if response.headers.get("ETag"):
+        write_cache(ETAG_CACHE_FILE, key, {
+            "etag": response.headers["ETag"],
+            "data": data,
+            "links": links
+        })
+    return data, links
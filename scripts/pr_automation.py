@@ -12,18 +12,37 @@ import os
 import sys
 import time
 import click
-import requests
-from github import Github
-from colorama import init, Fore, Style
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Dict, Optional, Set
 
-init(autoreset=True)
+from github_client import (
+    TOKEN_ENV_VARS, conditional_get, get_login, graphql, search_repositories
+)
+from colors import Fore, Style
+
+ETAG_TTL = 10 * 60  # Revalidate probed listings with their ETag for this long
+PR_SEARCH_BATCH_SIZE = 50  # repo: qualifiers per PR search
+DESCRIPTION_LENGTH = 80  # Descriptions are only ever shown this long
+
+# The user's PRs across a set of repositories, repository names only
+USER_PRS_QUERY = """
+query($query: String!, $after: String) {
+  search(query: $query, type: ISSUE, first: 100, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes { ... on PullRequest { repository { nameWithOwner } } }
+  }
+}
+"""
 
 class PRAutomation:
     def __init__(self, token: str):
-        self.github = Github(token)
         self.token = token
-        self.user = self.github.get_user()
+        
+    @cached_property
+    def login(self) -> str:
+        """The authenticated user's login, looked up only when a command needs it"""
+        return get_login(self.token)
         
     def find_repositories_for_contribution(self, 
                                          language: Optional[str] = None, 
@@ -46,25 +65,32 @@ class PRAutomation:
         
         repos = []
         try:
-            search_result = self.github.search_repositories(search_query, sort="updated")
+            candidates = search_repositories(self.token, search_query, max_results)
             
-            for repo in search_result[:max_results]:
+            login = self.login
+            try:
+                contributed = self._repos_with_user_prs(candidates, login)
+            except Exception as e:
+                print(f"{Fore.YELLOW}GraphQL PR search failed ({e}), checking repositories one by one")
+                # One blocking PR lookup per repo, so overlap them; the cap
+                # keeps clear of secondary rate limits
+                with ThreadPoolExecutor(max_workers=10) as executor:
+                    has_prs = executor.map(lambda repo: self._has_user_prs(repo, login), candidates)
+                    contributed = {repo["full_name"] for repo, found in zip(candidates, has_prs) if found}
+                    
+            for repo in candidates:
                 # Skip if user already has PRs in this repo
-                try:
-                    prs = list(repo.get_pulls(state='all', head=f"{self.user.login}:"))
-                    if len(prs) > 0:
-                        continue
-                except:
-                    pass  # Repo might not allow access to PRs
+                if repo["full_name"] in contributed:
+                    continue
                     
                 repos.append({
-                    'name': repo.full_name,
-                    'description': repo.description or "No description",
-                    'stars': repo.stargazers_count,
-                    'language': repo.language,
-                    'url': repo.html_url,
-                    'clone_url': repo.clone_url,
-                    'open_issues': repo.open_issues_count
+                    'name': repo["full_name"],
+                    'description': (repo["description"] or "No description")[:DESCRIPTION_LENGTH],
+                    'stars': repo["stargazers_count"],
+                    'language': repo["language"],
+                    'url': repo["html_url"],
+                    'clone_url': repo["clone_url"],
+                    'open_issues': repo["open_issues_count"]
                 })
                 
         except Exception as e:
@@ -72,6 +98,45 @@ class PRAutomation:
             
         return repos
         
+    def _repos_with_user_prs(self, repos: List[Dict], login: str) -> Set[str]:
+        """Find which repositories already have a PR by the user, one search per batch"""
+        contributed = set()
+        for start in range(0, len(repos), PR_SEARCH_BATCH_SIZE):
+            repo_filter = " ".join(
+                f"repo:{repo['full_name']}" for repo in repos[start:start + PR_SEARCH_BATCH_SIZE]
+            )
+            # A batch can hold more than one page of PRs; a repo missed on
+            # the first page would be suggested again
+            cursor = None
+            while True:
+                search = graphql(self.token, USER_PRS_QUERY, {
+                    "query": f"is:pr author:{login} {repo_filter}",
+                    "after": cursor
+                })["search"]
+                contributed.update(
+                    node["repository"]["nameWithOwner"]
+                    for node in search["nodes"] if node and node.get("repository")
+                )
+                if not search["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = search["pageInfo"]["endCursor"]
+        return contributed
+        
+    def _has_user_prs(self, repo: Dict, login: str) -> bool:
+        """Check whether the user already has pull requests in a repository"""
+        try:
+            # One item is enough to know, and a 304 on an unchanged listing
+            # costs no rate limit
+            pulls, _ = conditional_get(
+                self.token,
+                f"/repos/{repo['full_name']}/pulls",
+                {"state": "all", "head": f"{login}:", "per_page": 1},
+                ttl=ETAG_TTL
+            )
+            return len(pulls) > 0
+        except Exception:
+            return False  # Repo might not allow access to PRs
+            
     def suggest_contribution_types(self) -> List[str]:
         """Suggest types of contributions that are likely to be accepted"""
         return [
@@ -148,7 +213,7 @@ This PR fixes various typos and improves text clarity throughout the project.
         return templates.get(contribution_type, templates["documentation"])
 
 @click.command()
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar=TOKEN_ENV_VARS, help='GitHub personal access token')
 @click.option('--language', help='Filter repositories by programming language')
 @click.option('--max-results', default=20, help='Maximum number of repositories to show')
 @click.option('--min-stars', default=10, help='Minimum number of stars for repositories')
@@ -157,7 +222,7 @@ def main(token, language, max_results, min_stars, interactive):
     """GitHub PR Automation Tool for earning achievement badges"""
     
     if not token:
-        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --token")
+        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN (or BADGE_CLI_GITHUB_TOKEN) or use --token")
         sys.exit(1)
         
     print(f"{Fore.GREEN}🚀 GitHub Achievement PR Automation Tool")
@@ -166,7 +231,7 @@ def main(token, language, max_results, min_stars, interactive):
     
     automation = PRAutomation(token)
     
-    print(f"{Fore.CYAN}👤 Authenticated as: {automation.user.login}")
+    print(f"{Fore.CYAN}👤 Authenticated as: {automation.login}")
     print()
     
     # Find suitable repositories
@@ -188,7 +253,7 @@ def main(token, language, max_results, min_stars, interactive):
     for i, repo in enumerate(repos, 1):
         print(f"{Fore.CYAN}{i:2d}. {repo['name']}")
         print(f"    ⭐ {repo['stars']} stars | 🐛 {repo['open_issues']} issues | 💻 {repo['language'] or 'Mixed'}")
-        print(f"    📝 {repo['description'][:80]}...")
+        print(f"    📝 {repo['description']}...")
         print(f"    🔗 {repo['url']}")
         print()
         
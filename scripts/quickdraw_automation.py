@@ -10,29 +10,27 @@ import os
 import sys
 import time
 import click
-import requests
-from datetime import datetime, timedelta
-from github import Github
-from colorama import init, Fore, Style
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 
-init(autoreset=True)
+from github_client import (
+    TOKEN_ENV_VARS, GraphQLError, conditional_get, first_items, get_github, graphql, read_cache,
+    rest_send, token_key, write_cache
+)
+from colors import Fore, Style
 
-class QuickdrawAutomation:
-    def __init__(self, token: str):
-        self.github = Github(token)
-        self.token = token
-        self.user = self.github.get_user()
-        
-    def create_and_close_issue_quickly(self, repo_name: str, delay_seconds: int = 30):
-        """Create an issue and close it quickly for Quickdraw badge"""
-        
-        try:
-            repo = self.github.get_repo(repo_name)
-            
-            # Create a simple issue
-            issue_title = "docs: quick documentation improvement suggestion"
-            issue_body = """## Summary
+OWN_REPOS_CACHE_FILE = "own_repos.json"
+OWN_REPOS_CACHE_TTL = 5 * 60  # Back-to-back runs reuse the repository listing
+ETAG_TTL = 10 * 60  # Revalidate polled listings with their ETag for this long
+BATCH_WORKERS = 5  # Concurrent issue writes; writes are what secondary limits watch
+MONITORED_REPOS = 5  # Owner repositories checked by monitor
+RECENT_ITEMS_PER_REPO = 3  # Newest open issues and PRs checked in each
+
+# Placeholder issue opened and closed by the quickdraw cycle
+ISSUE_TITLE = "docs: quick documentation improvement suggestion"
+ISSUE_BODY = """## Summary
 Quick suggestion for documentation improvement.
 
 ## Suggestion
@@ -41,19 +39,106 @@ This is a quick documentation improvement suggestion that can be implemented eas
 ## Action
 Closing this issue as it will be addressed in an upcoming PR.
 """
-            
+CLOSE_COMMENT = "Closing this issue as the suggestion will be implemented in future documentation updates."
+
+# Comment on and close a quickdraw issue in a single round trip
+CLOSE_ISSUE_MUTATION = """
+mutation($issueId: ID!, $body: String!) {
+  comment: addComment(input: {subjectId: $issueId, body: $body}) { clientMutationId }
+  close: closeIssue(input: {issueId: $issueId}) { issue { closed } }
+}
+"""
+
+# Manual PR steps, with the colour codes resolved once
+PR_INSTRUCTIONS_TEMPLATE = f"""
+{Fore.GREEN}Quick PR Instructions for {{repo}}:
+
+1. Clone the repository:
+   git clone https://github.com/{{repo}}.git
+   cd {{short}}
+
+2. Create a new branch:
+   git checkout -b quickdraw/documentation-update
+
+3. Make a simple change (add a comment or fix a typo):
+   echo "<!-- Quick documentation update -->" >> README.md
+
+4. Commit and push:
+   git add .
+   git commit -m "docs: quick documentation update"
+   git push origin quickdraw/documentation-update
+
+5. Create PR via GitHub web interface
+
+6. Immediately close the PR with comment:
+   "Closing this PR as the change will be implemented differently"
+
+{Fore.MAGENTA}🏆 This will earn you the Quickdraw badge if done within 5 minutes!
+"""
+
+# One monitor listing entry, formatted per item and written with the rest
+MONITOR_ROW_TEMPLATE = (
+    "  {type} #{number}: {title}...\n"
+    "    Age: {age:.1f} minutes | Remaining: {remaining:.1f} minutes\n"
+    "    URL: {url}\n"
+)
+
+# Newest open issues and PRs of the most recently updated owner repositories,
+# in one request
+RECENT_ACTIVITY_QUERY = """
+query($repos: Int!, $items: Int!) {
+  viewer {
+    repositories(first: $repos, ownerAffiliations: OWNER, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        nameWithOwner
+        hasIssuesEnabled
+        issues(first: $items, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { number title url createdAt }
+        }
+        pullRequests(first: $items, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { number title url createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse GitHub's fixed YYYY-MM-DDTHH:MM:SSZ format into a naive UTC datetime"""
+    # Plain slicing skips strptime's format parsing and locale handling
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]), int(value[17:19])
+    )
+
+class QuickdrawAutomation:
+    def __init__(self, token: str):
+        self.token = token
+        
+    @cached_property
+    def github(self):
+        """Shared pooled client, built only when a command talks to GitHub"""
+        return get_github(self.token)
+        
+    @cached_property
+    def user(self):
+        """The authenticated user; get_user() itself makes no request"""
+        return self.github.get_user()
+        
+    def create_and_close_issue_quickly(self, repo_name: str, delay_seconds: int = 30):
+        """Create an issue and close it quickly for Quickdraw badge"""
+        
+        try:
             print(f"{Fore.CYAN}Creating issue in {repo_name}...")
-            issue = repo.create_issue(title=issue_title, body=issue_body)
-            print(f"{Fore.GREEN}✅ Issue created: {issue.html_url}")
+            issue = self._open_quickdraw_issue(repo_name)
+            print(f"{Fore.GREEN}✅ Issue created: {issue['html_url']}")
             
             # Wait for specified delay
             print(f"{Fore.YELLOW}⏳ Waiting {delay_seconds} seconds before closing...")
             time.sleep(delay_seconds)
             
-            # Close the issue with a comment
-            close_comment = "Closing this issue as the suggestion will be implemented in future documentation updates."
-            issue.create_comment(close_comment)
-            issue.edit(state='closed')
+            self._close_quickdraw_issue(issue)
             
             print(f"{Fore.GREEN}✅ Issue closed successfully!")
             print(f"{Fore.MAGENTA}🏆 Quickdraw badge progress: Issue opened and closed within {delay_seconds} seconds!")
@@ -64,22 +149,101 @@ Closing this issue as it will be addressed in an upcoming PR.
             print(f"{Fore.RED}❌ Error: {e}")
             return False
             
-    def find_own_repositories(self) -> List[Dict]:
+    def create_and_close_issues_batch(self, repo_names: List[str], delay_seconds: int = 30) -> int:
+        """Run the quickdraw issue cycle on several repositories with one shared wait
+        
+        Issues are opened and closed concurrently, so the batch takes about one
+        delay rather than one per repository. Returns how many were closed.
+        """
+        print(f"{Fore.CYAN}Creating issues in {len(repo_names)} repositories...")
+        with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as executor:
+            issues = [issue for issue in executor.map(self._try_open_quickdraw_issue, repo_names) if issue]
+            if not issues:
+                return 0
+                
+            print(f"{Fore.YELLOW}⏳ Waiting {delay_seconds} seconds before closing...")
+            time.sleep(delay_seconds)
+            
+            closed = sum(executor.map(self._try_close_quickdraw_issue, issues))
+            
+        print(f"{Fore.MAGENTA}🏆 Quickdraw badge progress: {closed} issues opened and closed within {delay_seconds} seconds!")
+        return closed
+        
+    def _open_quickdraw_issue(self, repo_name: str) -> Dict:
+        """Open the quickdraw placeholder issue in a repository"""
+        # Raw calls on the shared keep-alive session, so the create, comment
+        # and close requests reuse one connection
+        return rest_send(self.token, "POST", f"/repos/{repo_name}/issues", {
+            "title": ISSUE_TITLE,
+            "body": ISSUE_BODY
+        })
+        
+    def _close_quickdraw_issue(self, issue: Dict):
+        """Close a quickdraw issue with an explanatory comment, in one request"""
+        try:
+            graphql(self.token, CLOSE_ISSUE_MUTATION, {
+                "issueId": issue["node_id"],
+                "body": CLOSE_COMMENT
+            })
+            return
+        except GraphQLError as e:
+            # Mutations run in order; only redo the ones that did not land
+            done = e.data or {}
+            print(f"{Fore.YELLOW}GraphQL close failed ({e}), falling back to REST")
+        except Exception as e:
+            done = {}
+            print(f"{Fore.YELLOW}GraphQL close failed ({e}), falling back to REST")
+            
+        if not done.get("comment"):
+            rest_send(self.token, "POST", issue["comments_url"], {"body": CLOSE_COMMENT})
+        if not done.get("close"):
+            rest_send(self.token, "PATCH", issue["url"], {"state": "closed"})
+        
+    def _try_open_quickdraw_issue(self, repo_name: str) -> Optional[Dict]:
+        """Open a quickdraw issue for a batch, reporting failures instead of raising"""
+        try:
+            issue = self._open_quickdraw_issue(repo_name)
+            print(f"{Fore.GREEN}✅ Issue created: {issue['html_url']}")
+            return issue
+        except Exception as e:
+            print(f"{Fore.RED}❌ Error creating issue in {repo_name}: {e}")
+            return None
+            
+    def _try_close_quickdraw_issue(self, issue: Dict) -> bool:
+        """Close a batch's quickdraw issue, reporting failures instead of raising"""
+        try:
+            self._close_quickdraw_issue(issue)
+            print(f"{Fore.GREEN}✅ Issue closed: {issue['html_url']}")
+            return True
+        except Exception as e:
+            print(f"{Fore.RED}❌ Error closing {issue['html_url']}: {e}")
+            return False
+            
+    def find_own_repositories(self, refresh: bool = False) -> List[Dict]:
         """Find user's own repositories suitable for quickdraw"""
         
+        cache_key = token_key(self.token)
+        if not refresh:
+            repos = read_cache(OWN_REPOS_CACHE_FILE, cache_key, OWN_REPOS_CACHE_TTL)
+            if repos is not None:
+                return repos
+                
         repos = []
         try:
             user_repos = self.user.get_repos(type='owner')
             
-            for repo in user_repos:
-                if not repo.private:  # Only public repos for achievements
+            # Read the listing payloads directly; PyGithub attribute access
+            # can lazily re-fetch a repository for fields it considers unset
+            for repo in (repo._rawData for repo in user_repos):
+                if not repo["private"]:  # Only public repos for achievements
                     repos.append({
-                        'name': repo.full_name,
-                        'description': repo.description or "No description",
-                        'url': repo.html_url,
-                        'issues_enabled': repo.has_issues
+                        'name': repo["full_name"],
+                        'description': repo["description"] or "No description",
+                        'url': repo["html_url"],
+                        'issues_enabled': repo["has_issues"]
                     })
                     
+            write_cache(OWN_REPOS_CACHE_FILE, cache_key, repos)
         except Exception as e:
             print(f"{Fore.RED}Error fetching repositories: {e}")
             
@@ -92,31 +256,7 @@ Closing this issue as it will be addressed in an upcoming PR.
         print(f"{Fore.YELLOW}Note: This creates a simple documentation PR that can be closed quickly")
         
         # Instructions for manual PR creation since we can't clone/push in this context
-        instructions = f"""
-{Fore.GREEN}Quick PR Instructions for {repo_name}:
-
-1. Clone the repository:
-   git clone https://github.com/{repo_name}.git
-   cd {repo_name.split('/')[-1]}
-
-2. Create a new branch:
-   git checkout -b quickdraw/documentation-update
-
-3. Make a simple change (add a comment or fix a typo):
-   echo "<!-- Quick documentation update -->" >> README.md
-
-4. Commit and push:
-   git add .
-   git commit -m "docs: quick documentation update"
-   git push origin quickdraw/documentation-update
-
-5. Create PR via GitHub web interface
-
-6. Immediately close the PR with comment:
-   "Closing this PR as the change will be implemented differently"
-
-{Fore.MAGENTA}🏆 This will earn you the Quickdraw badge if done within 5 minutes!
-"""
+        instructions = PR_INSTRUCTIONS_TEMPLATE.format(repo=repo_name, short=repo_name.rsplit('/', 1)[-1])
         
         print(instructions)
         return True
@@ -127,69 +267,136 @@ Closing this issue as it will be addressed in an upcoming PR.
         print(f"{Fore.CYAN}🔍 Monitoring recent activity for quickdraw opportunities...")
         
         try:
-            # Get recent issues from user's repositories
-            user_repos = list(self.user.get_repos(type='owner'))[:5]  # Check first 5 repos
+            try:
+                candidates = self._recent_candidates_graphql()
+            except Exception as e:
+                print(f"{Fore.YELLOW}GraphQL activity query failed ({e}), falling back to REST")
+                candidates = self._recent_candidates_rest()
+                
+            # One clock read for every item; creation times are naive UTC
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            cutoff = now - timedelta(seconds=300)  # Less than 5 minutes old
             
             recent_items = []
-            
-            for repo in user_repos:
-                if not repo.has_issues:
-                    continue
-                    
-                try:
-                    # Get recent issues
-                    issues = list(repo.get_issues(state='open', sort='created'))[:3]
-                    for issue in issues:
-                        time_diff = datetime.now() - issue.created_at.replace(tzinfo=None)
-                        if time_diff.total_seconds() < 300:  # Less than 5 minutes old
-                            recent_items.append({
-                                'type': 'issue',
-                                'repo': repo.full_name,
-                                'title': issue.title,
-                                'url': issue.html_url,
-                                'age_seconds': time_diff.total_seconds(),
-                                'number': issue.number
-                            })
-                            
-                    # Get recent PRs
-                    prs = list(repo.get_pulls(state='open', sort='created'))[:3]
-                    for pr in prs:
-                        time_diff = datetime.now() - pr.created_at.replace(tzinfo=None)
-                        if time_diff.total_seconds() < 300:  # Less than 5 minutes old
-                            recent_items.append({
-                                'type': 'pr',
-                                'repo': repo.full_name,
-                                'title': pr.title,
-                                'url': pr.html_url,
-                                'age_seconds': time_diff.total_seconds(),
-                                'number': pr.number
-                            })
-                            
-                except Exception as e:
+            for item in candidates:
+                created = item.pop('created_at')
+                if created <= cutoff:
                     continue
+                item['age_seconds'] = (now - created).total_seconds()
+                recent_items.append(item)
                     
             if recent_items:
-                print(f"{Fore.GREEN}🎯 Found {len(recent_items)} recent items for quickdraw:")
+                out = [f"{Fore.GREEN}🎯 Found {len(recent_items)} recent items for quickdraw:{Style.RESET_ALL}"]
                 for item in recent_items:
                     age_minutes = item['age_seconds'] / 60
-                    remaining_time = 5 - age_minutes
-                    print(f"  {item['type'].upper()} #{item['number']}: {item['title'][:50]}...")
-                    print(f"    Age: {age_minutes:.1f} minutes | Remaining: {remaining_time:.1f} minutes")
-                    print(f"    URL: {item['url']}")
-                    print()
+                    out.append(MONITOR_ROW_TEMPLATE.format(
+                        type=item['type'].upper(),
+                        number=item['number'],
+                        title=item['title'][:50],
+                        age=age_minutes,
+                        remaining=5 - age_minutes,
+                        url=item['url']
+                    ))
+                sys.stdout.write("\n".join(out) + "\n")
             else:
                 print(f"{Fore.YELLOW}No recent items found for quickdraw opportunities")
                 
         except Exception as e:
             print(f"{Fore.RED}Error monitoring activity: {e}")
+            
+    def _recent_candidates_graphql(self) -> List[Dict]:
+        """Newest open issues and PRs of the monitored repositories, in one request"""
+        data = graphql(self.token, RECENT_ACTIVITY_QUERY, {
+            "repos": MONITORED_REPOS,
+            "items": RECENT_ITEMS_PER_REPO
+        })
+        
+        candidates = []
+        for repo in data["viewer"]["repositories"]["nodes"]:
+            if not repo["hasIssuesEnabled"]:
+                continue
+                
+            for item_type, items in (('issue', repo["issues"]), ('pr', repo["pullRequests"])):
+                for node in items["nodes"]:
+                    candidates.append({
+                        'type': item_type,
+                        'repo': repo["nameWithOwner"],
+                        'title': node["title"],
+                        'url': node["url"],
+                        'number': node["number"],
+                        'created_at': _parse_timestamp(node["createdAt"])
+                    })
+        return candidates
+        
+    def _recent_candidates_rest(self) -> List[Dict]:
+        """Newest open issues and PRs of the monitored repositories, over REST"""
+        # Get recent issues from user's repositories. Only the first page is fetched, and the most recently updated
+        # repositories are the ones likely to have fresh issues
+        user_repos = first_items(
+            self.user.get_repos(type='owner', sort='updated', direction='desc'), MONITORED_REPOS
+        )
+        # has_issues comes with the listing, so skipping repos costs no request
+        repo_names = [repo._rawData["full_name"] for repo in user_repos if repo._rawData["has_issues"]]
+        
+        # Two blocking GETs per repo, so overlap them on the pooled session
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            per_repo = executor.map(self._fetch_recent, repo_names)
+            return [item for items in per_repo for item in items]
+            
+    def _fetch_recent(self, repo_name: str) -> List[Dict]:
+        """Newest open issues and PRs of one repository, read from the raw JSON"""
+        params = {"state": "open", "sort": "created", "direction": "desc", "per_page": RECENT_ITEMS_PER_REPO}
+        
+        candidates = []
+        try:
+            for item_type, path in (('issue', 'issues'), ('pr', 'pulls')):
+                # Repeat polls of an unchanged listing come back as a 304
+                # that costs no rate limit
+                items, _ = conditional_get(self.token, f"/repos/{repo_name}/{path}", params, ttl=ETAG_TTL)
+                for item in items:
+                    candidates.append({
+                        'type': item_type,
+                        'repo': repo_name,
+                        'title': item["title"],
+                        'url': item["html_url"],
+                        'number': item["number"],
+                        'created_at': _parse_timestamp(item["created_at"])
+                    })
+                    
+        except Exception:
+            pass  # Skip repos we can't read
+            
+        return candidates
+
+def _prompt_for_repo(automation: QuickdrawAutomation, refresh: bool,
+                     show_issue_flag: bool = False) -> Optional[str]:
+    """List the user's repositories and return the chosen owner/repo, or None"""
+    repos = automation.find_own_repositories(refresh=refresh)
+    if not repos:
+        print(f"{Fore.RED}❌ No suitable repositories found")
+        return None
+        
+    # Build the listing and write it once instead of a print per line
+    lines = [f"{Fore.CYAN}Your repositories:{Style.RESET_ALL}"]
+    for i, r in enumerate(repos, 1):
+        status = ("✅ " if r['issues_enabled'] else "❌ ") if show_issue_flag else ""
+        lines.append(f"  {i}. {status}{r['name']} - {r['description'][:50]}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    choice = click.prompt("Select repository number", type=int)
+    if 1 <= choice <= len(repos):
+        return repos[choice - 1]['name']
+        
+    print(f"{Fore.RED}Invalid choice")
+    return None
 
 @click.group()
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar=TOKEN_ENV_VARS, help='GitHub personal access token')
 @click.pass_context
 def cli(ctx, token):
     """Quickdraw Achievement Automation Tool"""
     if not token:
-        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN environment variable or use --token")
+        print(f"{Fore.RED}Error: GitHub token is required. Set GITHUB_TOKEN (or BADGE_CLI_GITHUB_TOKEN) or use --token")
         sys.exit(1)
         
     ctx.ensure_object(dict)
@@ -198,58 +405,40 @@ def cli(ctx, token):
 @cli.command()
 @click.option('--repo', help='Repository name (owner/repo)')
 @click.option('--delay', default=30, help='Delay in seconds before closing (default: 30)')
+@click.option('--refresh', is_flag=True, help='Re-list repositories instead of using the cached list')
 @click.pass_context
-def quick_issue(ctx, repo, delay):
+def quick_issue(ctx, repo, delay, refresh):
     """Create and quickly close an issue for Quickdraw badge"""
     
     automation = ctx.obj['automation']
     
-    if not repo:
-        repos = automation.find_own_repositories()
-        if not repos:
-            print(f"{Fore.RED}❌ No suitable repositories found")
-            return
-            
-        print(f"{Fore.CYAN}Your repositories:")
-        for i, r in enumerate(repos, 1):
-            status = "✅" if r['issues_enabled'] else "❌"
-            print(f"  {i}. {status} {r['name']} - {r['description'][:50]}")
-            
-        choice = click.prompt("Select repository number", type=int)
-        if 1 <= choice <= len(repos):
-            repo = repos[choice - 1]['name']
-        else:
-            print(f"{Fore.RED}Invalid choice")
-            return
-            
-    automation.create_and_close_issue_quickly(repo, delay)
+    repo = repo or _prompt_for_repo(automation, refresh, show_issue_flag=True)
+    if repo:
+        automation.create_and_close_issue_quickly(repo, delay)
 
 @cli.command()
 @click.option('--repo', help='Repository name (owner/repo)')
+@click.option('--refresh', is_flag=True, help='Re-list repositories instead of using the cached list')
 @click.pass_context  
-def quick_pr(ctx, repo):
+def quick_pr(ctx, repo, refresh):
     """Get instructions for creating and quickly closing a PR"""
     
     automation = ctx.obj['automation']
     
-    if not repo:
-        repos = automation.find_own_repositories()
-        if not repos:
-            print(f"{Fore.RED}❌ No suitable repositories found")
-            return
-            
-        print(f"{Fore.CYAN}Your repositories:")
-        for i, r in enumerate(repos, 1):
-            print(f"  {i}. {r['name']} - {r['description'][:50]}")
-            
-        choice = click.prompt("Select repository number", type=int)
-        if 1 <= choice <= len(repos):
-            repo = repos[choice - 1]['name']
-        else:
-            print(f"{Fore.RED}Invalid choice")
-            return
-            
-    automation.create_quick_pr_cycle(repo)
+    repo = repo or _prompt_for_repo(automation, refresh)
+    if repo:
+        automation.create_quick_pr_cycle(repo)
+
+@cli.command()
+@click.option('--repos', required=True, help='Comma-separated repository names (owner/repo,owner/repo)')
+@click.option('--delay', default=30, help='Delay in seconds before closing (default: 30)')
+@click.pass_context
+def batch_quickdraw(ctx, repos, delay):
+    """Create and quickly close an issue in several repositories at once"""
+    
+    automation = ctx.obj['automation']
+    repo_names = [name.strip() for name in repos.split(',') if name.strip()]
+    automation.create_and_close_issues_batch(repo_names, delay)
 
 @cli.command()
 @click.pass_context
@@ -295,11 +484,12 @@ Close an issue or pull request within 5 minutes of opening it.
 
 {Fore.GREEN}Commands:
 • quickdraw quick-issue --repo owner/repo    # Create and close issue
+• quickdraw batch-quickdraw --repos a/x,b/y  # Issue cycle in several repos
 • quickdraw quick-pr --repo owner/repo       # Get PR instructions  
 • quickdraw monitor                          # Check recent activity
 """
     
-    print(guide_text)
+    sys.stdout.write(guide_text + "\n")
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file